@@ -3,9 +3,21 @@ import asyncio
 from src.app import TelegramBot
 from src.config import settings
 
+try:
+    import uvloop
+except ImportError:  # uvloop недоступен на Windows
+    uvloop = None
+
 
 async def main():
-    bot = TelegramBot(token=settings.bot_token, server_ip=settings.bot_server_ip)
+    # Настройки вебхука необязательны: если поля bot_webhook_url нет в Settings
+    # или оно пустое, бот работает через long polling
+    bot = TelegramBot(
+        token=settings.bot_token,
+        server_ip=settings.bot_server_ip,
+        webhook_url=getattr(settings, "bot_webhook_url", None),
+        webhook_secret=getattr(settings, "bot_webhook_secret", None),
+    )
     try:
         await bot.start()
     except KeyboardInterrupt:
@@ -13,4 +25,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
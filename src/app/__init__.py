@@ -1,14 +1,17 @@
 from .bot import TelegramBot
 from .filters import URLFilter
-from .common import ServiceType
+from .common import ServiceType, ServiceDescriptor
 from .patterns import DomainMatcher
 from .handlers import ServiceHandler
+from .middlewares import DuplicateURLMiddleware
 
 
 __all__ = [
     "URLFilter",
     "TelegramBot",
     "ServiceType",
+    "ServiceDescriptor",
     "DomainMatcher",
     "ServiceHandler",
+    "DuplicateURLMiddleware",
 ]
@@ -3,47 +3,82 @@
 Поддерживает YouTube, Instagram, TikTok, Reddit и другие платформы.
 """
 
+import asyncio
 import logging
 from datetime import datetime
-from urllib.parse import urlparse
-from typing import Optional, Dict, Callable
+from types import MappingProxyType
+from typing import Optional, Mapping, Callable
 
+import msgspec
+from aiohttp import web
 from aiogram.enums import ParseMode
-from aiogram import Bot, Dispatcher, F, types
+from aiogram import Bot, Dispatcher, F, Router, types
+from aiogram.types import ErrorEvent
 from aiogram.filters import CommandStart, Command
 from aiogram.client.telegram import TelegramAPIServer
 from aiogram.client.default import DefaultBotProperties
 from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
 
 from .filters import URLFilter
-from .common import ServiceType
+from .common import URL_ERROR_TEXT, ServiceDescriptor, ServiceType
 from .patterns import DomainMatcher
-from .handlers import ServiceHandler
+from .handlers import ServiceHandler, media_info_batcher
+from .middlewares import DuplicateURLMiddleware
 from .callback_handlers import ServiceCallbackHandler
 
 
+# Статические тексты ответов
+WELCOME_TEXT = (
+    "🎉 <b>Добро пожаловать в Медиа Бот!</b>\n\n"
+    "Я помогу вам скачать медиа-контент из популярных социальных сетей. "
+    "Просто отправьте мне ссылку, и я предложу доступные варианты загрузки.\n\n"
+    "💡 <b>Примеры поддерживаемых платформ:</b>\n"
+    "• YouTube, Instagram, TikTok\n"
+    "• Reddit, Rutube и другие\n\n"
+)
+
+UNKNOWN_MESSAGE_TEXT = (
+    "🤔 <b>Не понял ваше сообщение</b>\n\n"
+    "Я специализируюсь на обработке ссылок из социальных сетей. "
+    "Отправьте мне ссылку или используйте команды:\n\n"
+    "/start - Начать работу\n"
+    "/help - Получить помощь"
+)
+
+UNSUPPORTED_DOMAIN_TEMPLATE = (
+    "❌ <b>Домен не поддерживается</b>\n\n"
+    "К сожалению, домен <code>{domain}</code> пока не поддерживается.\n\n"
+    "<b>🔄 Поддерживаемые сервисы:</b>\n"
+    "{supported_services}\n\n"
+    "💡 Используйте /help для подробной информации"
+)
+
+# Маппинг префиксов callback данных на обработчики
+CALLBACK_HANDLER_MAP: Mapping[str, Callable] = MappingProxyType({
+    "video": ServiceCallbackHandler.handle_video,
+    "image": ServiceCallbackHandler.handle_image,
+    "audio": ServiceCallbackHandler.handle_audio,
+    "thumbnail": ServiceCallbackHandler.handle_thumbnail,
+})
+
+
 class TelegramBot:
     """
     Главный класс Telegram бота для обработки медиа-контента.
-    
-    Реализует паттерн Singleton для обеспечения единственного экземпляра бота.
     """
-    
-    _instance = None
-    _initialized = False
-    
-    def __new__(cls, *args, **kwargs) -> 'TelegramBot':
-        """Реализация паттерна Singleton."""
-        if cls._instance is None:
-            cls._instance = super(TelegramBot, cls).__new__(cls)
-        return cls._instance
 
     def __init__(
         self, 
         token: str, 
         server_ip: str = "http://localhost:8081", 
         parse_mode: ParseMode = ParseMode.HTML, 
-        loglevel: int = logging.INFO
+        loglevel: int = logging.INFO,
+        webhook_url: Optional[str] = None,
+        webhook_secret: Optional[str] = None,
+        webhook_host: str = "0.0.0.0",
+        webhook_port: int = 8080,
+        webhook_path: str = "/webhook"
     ) -> None:
         """
         Инициализация бота.
@@ -53,27 +88,35 @@ class TelegramBot:
             server_ip: Адрес кастомного Telegram API сервера
             parse_mode: Режим парсинга сообщений
             loglevel: Уровень логирования
+            webhook_url: Публичный URL вебхука; если не задан, используется long polling
+            webhook_secret: Секретный токен для проверки запросов от Telegram
+            webhook_host: Адрес, на котором слушает веб-сервер вебхука
+            webhook_port: Порт веб-сервера вебхука
+            webhook_path: Путь обработчика вебхука
         """
-        if not self._initialized:
-            self.token = token
-            self.server_ip = server_ip
-            self.parse_mode = parse_mode
-            self.loglevel = loglevel
-            self.start_time = datetime.now()
-            
-            # Основные компоненты бота
-            self.bot: Optional[Bot] = None
-            self.dp: Optional[Dispatcher] = None
-            self.session: Optional[AiohttpSession] = None
-            
-            self._setup_logging()
-            self._initialize_bot()
-            self._register_handlers()
-            self._register_callback_handlers()
-            
-            self._initialized = True
-            self.logger.info("🤖 Бот успешно инициализирован!")
-            
+        self.token = token
+        self.server_ip = server_ip
+        self.parse_mode = parse_mode
+        self.loglevel = loglevel
+        self.webhook_url = webhook_url
+        self.webhook_secret = webhook_secret
+        self.webhook_host = webhook_host
+        self.webhook_port = webhook_port
+        self.webhook_path = webhook_path
+        self.start_time = datetime.now()
+        
+        # Основные компоненты бота
+        self.bot: Optional[Bot] = None
+        self.dp: Optional[Dispatcher] = None
+        self.session: Optional[AiohttpSession] = None
+        
+        self._setup_logging()
+        self._initialize_bot()
+        self._register_handlers()
+        self._register_callback_handlers()
+        
+        self.logger.info("🤖 Бот успешно инициализирован!")
+        
     def _setup_logging(self) -> None:
         """Настройка системы логирования."""
         logging.basicConfig(
@@ -87,9 +130,11 @@ class TelegramBot:
         """Инициализация основных компонентов бота."""
         self.logger.info("🔄 Инициализация компонентов бота...")
         
-        # Создание кастомной сессии с указанным сервером
+        # Создание кастомной сессии с указанным сервером.
+        # Ответы Bot API (включая getUpdates) декодируются msgspec вместо json.
         self.session = AiohttpSession(
-            api=TelegramAPIServer.from_base(self.server_ip)
+            api=TelegramAPIServer.from_base(self.server_ip),
+            json_loads=msgspec.json.decode
         )
         
         # Создание экземпляра бота с кастомными свойствами
@@ -108,10 +153,31 @@ class TelegramBot:
         """Регистрация обработчиков сообщений."""
         self.logger.info("📝 Регистрация обработчиков сообщений...")
         
-        self.dp.message.register(self._handle_start, CommandStart())
-        self.dp.message.register(self._handle_help, Command("help"))
-        self.dp.message.register(self._handle_url_message, URLFilter(check_support=True))
-        self.dp.message.register(self._handle_unknown_message)
+        # Справка и список сервисов статичны во время работы бота — формируем их один раз
+        self._help_text = self._build_help_text()
+        self._supported_services_text = ", ".join(
+            service_type.value for service_type in DomainMatcher.DOMAIN_PATTERNS
+        )
+        
+        # Команды
+        commands_router = Router(name="commands")
+        commands_router.message.register(self._handle_start, CommandStart())
+        commands_router.message.register(self._handle_help, Command("help"))
+        
+        # Ссылки: URLFilter проверяется один раз на уровне роутера,
+        # а его результат (url, domain, service_type) передается в обработчик.
+        # Повторная отправка той же ссылки в тот же чат отбрасывается до постановки задачи
+        url_router = Router(name="urls")
+        url_router.message.filter(URLFilter(check_support=True))
+        url_router.message.middleware(DuplicateURLMiddleware())
+        url_router.message.register(self._handle_url_message)
+        
+        # Все остальные сообщения
+        fallback_router = Router(name="fallback")
+        fallback_router.message.register(self._handle_unknown_message)
+        
+        self.dp.include_routers(commands_router, url_router, fallback_router)
+        self.dp.errors.register(self._handle_error)
         
         self.logger.info("✅ Обработчики сообщений зарегистрированы")
         
@@ -119,18 +185,24 @@ class TelegramBot:
         """Регистрация обработчиков callback запросов."""
         self.logger.info("🔄 Регистрация callback обработчиков...")
         
-        callback_handlers = {
-            "video": ServiceCallbackHandler.handle_video,
-            "image": ServiceCallbackHandler.handle_image,
-            "audio": ServiceCallbackHandler.handle_audio,
-            "thumbnail": ServiceCallbackHandler.handle_thumbnail,
-        }
-        
-        for prefix, handler in callback_handlers.items():
-            self.dp.callback_query.register(handler, F.data.startswith(prefix))
+        # Один обработчик с выбором по префиксу вместо фильтра на каждый префикс
+        callbacks_router = Router(name="callbacks")
+        callbacks_router.callback_query.register(self._dispatch_callback, F.data)
+        self.dp.include_router(callbacks_router)
             
         self.logger.info("✅ Callback обработчики зарегистрированы")
         
+    async def _dispatch_callback(self, callback: types.CallbackQuery) -> None:
+        """Маршрутизация callback запроса по префиксу данных."""
+        prefix = callback.data.partition(":")[0]
+        handler = CALLBACK_HANDLER_MAP.get(prefix)
+        if handler is None:
+            self.logger.warning(f"⚠️ Неизвестный callback: {callback.data}")
+            await callback.answer()
+            return
+        
+        await handler(callback)
+        
     async def _handle_start(self, message: types.Message) -> None:
         """Обработчик команды /start."""
         user_name = message.from_user.full_name
@@ -138,24 +210,11 @@ class TelegramBot:
         
         self.logger.info(f"👤 Новый пользователь: {user_name} (ID: {user_id})")
         
-        welcome_text = (
-            "🎉 <b>Добро пожаловать в Медиа Бот!</b>\n\n"
-            "Я помогу вам скачать медиа-контент из популярных социальных сетей. "
-            "Просто отправьте мне ссылку, и я предложу доступные варианты загрузки.\n\n"
-            "💡 <b>Примеры поддерживаемых платформ:</b>\n"
-            "• YouTube, Instagram, TikTok\n"
-            "• Reddit, Rutube и другие\n\n"
-        )
-        
-        await message.answer(
-            welcome_text,
-            parse_mode=ParseMode.HTML
-        )
+        await message.answer(WELCOME_TEXT)
             
-    async def _handle_help(self, message: types.Message) -> None:
-        """Показать расширенную справку с поддерживаемыми доменами."""
-        self.logger.info(f"Пользователь {message.from_user.full_name} запросил помощь")
-        
+    @staticmethod
+    def _build_help_text() -> str:
+        """Сформировать текст справки с поддерживаемыми доменами."""
         # Формирование списка поддерживаемых сервисов
         supported_services = []
         for service_type, domains in DomainMatcher.DOMAIN_PATTERNS.items():
@@ -164,7 +223,7 @@ class TelegramBot:
                 f"• <b>{service_type.value.upper()}</b> - {domain_examples}..."
             )
             
-        help_text = (
+        return (
             "🤖 <b>Медиа Бот - Помощь</b>\n\n"
             "📥 <b>Как использовать:</b>\n"
             "Просто отправьте ссылку из поддерживаемой социальной сети, "
@@ -177,94 +236,115 @@ class TelegramBot:
             "💡 <b>Совет:</b> Бот работает лучше всего с публично доступным контентом."
         )
         
-        await message.answer(help_text, parse_mode=ParseMode.HTML)
+    async def _handle_help(self, message: types.Message) -> None:
+        """Показать расширенную справку с поддерживаемыми доменами."""
+        self.logger.info(f"Пользователь {message.from_user.full_name} запросил помощь")
         
-    async def _handle_url_message(self, message: types.Message) -> None:
-        """Обработчик сообщений с URL."""
-        url = message.text or message.caption
-        if not url:
-            return
-
-        try:
-            parsed = urlparse(url.strip())
-            domain = parsed.netloc.lower()
-            service_type = DomainMatcher.get_service_type(domain)
-            
-            self.logger.info(
-                f"🔗 Обработка URL: {url} | "
-                f"Домен: {domain} | "
-                f"Сервис: {service_type.value}"
-            )
-            
-            # Маппинг обработчиков для разных сервисов
-            handler_map: Dict[ServiceType, Callable] = {
-                ServiceType.YOUTUBE: ServiceHandler.handle_youtube,
-                ServiceType.INSTAGRAM: ServiceHandler.handle_instagram,
-                ServiceType.REDDIT: ServiceHandler.handle_reddit,
-                ServiceType.RUTUBE: ServiceHandler.handle_rutube,
-                ServiceType.TIKTOK: ServiceHandler.handle_tiktok,
-            }
-            
-            if service_type in handler_map:
-                await handler_map[service_type](url, message, domain)
-            else:
-                await self._handle_unsupported_domain(domain, message)
-                
-        except Exception as e:
-            self.logger.error(f"❌ Ошибка обработки URL {url}: {str(e)}", exc_info=True)
+        await message.answer(self._help_text)
+        
+    async def _handle_url_message(
+        self,
+        message: types.Message,
+        url: str,
+        domain: str,
+        service_type: ServiceType,
+        service: Optional[ServiceDescriptor],
+        release_url: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Обработчик сообщений с URL.
+        
+        url (без пробелов), domain, service_type и описание сервиса
+        вычисляет и передает URLFilter; release_url передает
+        DuplicateURLMiddleware, чтобы после неудачной публикации задачи
+        повторная отправка ссылки не считалась дублем.
+        """
+        self.logger.info(
+            f"🔗 Обработка URL: {url} | "
+            f"Домен: {domain} | "
+            f"Сервис: {service_type.value}"
+        )
+        
+        # Исключения обработчиков сервисов обрабатывает _handle_error
+        if service is not None:
+            ServiceHandler.dispatch(service, url, message, on_failure=release_url)
+        else:
+            await self._handle_unsupported_domain(domain, message)
             
-            error_text = (
-                "❌ <b>Произошла ошибка при обработке ссылки</b>\n\n"
-                "Возможные причины:\n"
-                "• Ссылка недействительна\n"
-                "• Контент недоступен\n"
-                "• Временные проблемы с сервисом\n\n"
-                "Попробуйте позже или проверьте корректность ссылки."
-            )
-            await message.answer(error_text, parse_mode=ParseMode.HTML)
+    async def _handle_error(self, event: ErrorEvent) -> None:
+        """Централизованный обработчик ошибок при обработке обновлений."""
+        message = event.update.message
+        self.logger.error(
+            f"❌ Ошибка обработки обновления {event.update.update_id}: {event.exception}",
+            exc_info=event.exception
+        )
+        
+        if message is not None:
+            await message.answer(URL_ERROR_TEXT)
             
     async def _handle_unsupported_domain(self, domain: str, message: types.Message) -> None:
         """Обработчик неподдерживаемых доменов."""
         self.logger.warning(f"🚫 Неподдерживаемый домен: {domain}")
         
-        supported_services = ", ".join(
-            service_type.value for service_type in DomainMatcher.DOMAIN_PATTERNS.keys()
-        )
-        
-        response = (
-            f"❌ <b>Домен не поддерживается</b>\n\n"
-            f"К сожалению, домен <code>{domain}</code> пока не поддерживается.\n\n"
-            f"<b>🔄 Поддерживаемые сервисы:</b>\n"
-            f"{supported_services}\n\n"
-            f"💡 Используйте /help для подробной информации"
+        response = UNSUPPORTED_DOMAIN_TEMPLATE.format(
+            domain=domain,
+            supported_services=self._supported_services_text
         )
-        await message.answer(response, parse_mode=ParseMode.HTML)
+        await message.answer(response)
         
     async def _handle_unknown_message(self, message: types.Message) -> None:
         """Обработчик неизвестных сообщений."""
-        await message.answer(
-            "🤔 <b>Не понял ваше сообщение</b>\n\n"
-            "Я специализируюсь на обработке ссылок из социальных сетей. "
-            "Отправьте мне ссылку или используйте команды:\n\n"
-            "/start - Начать работу\n"
-            "/help - Получить помощь",
-            parse_mode=ParseMode.HTML
-        )
+        await message.answer(UNKNOWN_MESSAGE_TEXT)
 
     async def start(self) -> None:
         """Запуск бота."""
         self.logger.info("🚀 Запуск бота...")
         try:
-            await self.dp.start_polling(self.bot)
+            if self.webhook_url:
+                await self._run_webhook()
+            else:
+                # Вебхук, оставшийся после запуска в режиме вебхука, блокирует getUpdates
+                await self.bot.delete_webhook()
+                await self.dp.start_polling(self.bot)
         except Exception as e:
             self.logger.error(f"💥 Критическая ошибка при запуске бота: {e}")
             raise
         finally:
             await self.stop()
     
+    async def _run_webhook(self) -> None:
+        """Запуск бота в режиме вебхука на aiohttp сервере."""
+        app = web.Application()
+        SimpleRequestHandler(
+            dispatcher=self.dp,
+            bot=self.bot,
+            handle_in_background=True,
+            secret_token=self.webhook_secret
+        ).register(app, path=self.webhook_path)
+        setup_application(app, self.dp, bot=self.bot)
+        
+        await self.bot.set_webhook(url=self.webhook_url, secret_token=self.webhook_secret)
+        
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, host=self.webhook_host, port=self.webhook_port)
+        await site.start()
+        self.logger.info(
+            f"🌐 Вебхук слушает {self.webhook_host}:{self.webhook_port}{self.webhook_path}"
+        )
+        
+        try:
+            # Сервер работает до отмены задачи
+            await asyncio.Event().wait()
+        finally:
+            await runner.cleanup()
+    
     async def stop(self) -> None:
         """Корректная остановка бота."""
         self.logger.info("🛑 Остановка бота...")
+        # Публикуем принятые задачи до закрытия сессии: при ошибке публикации
+        # пользователям отправляется URL_ERROR_TEXT через эту же сессию
+        await media_info_batcher.close()
         if self.session:
             await self.session.close()
         self.logger.info("👋 Бот успешно остановлен")
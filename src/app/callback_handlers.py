@@ -1,8 +1,31 @@
-from typing import Dict, List
+import asyncio
+from functools import partial
+
 from aiogram.types import CallbackQuery, InputMediaPhoto
 
-from src.core.abstractions import AbstractServiceImageTypeDict
 from src.tasks.app import user_session_storage, user_activity_queue
+from src.tasks.downloads_worker import (
+    download_audio,
+    download_reddit_video, 
+    download_rutube_video, 
+    download_tiktok_video, 
+    download_youtube_video,
+)
+
+
+# Celery задачи загрузки видео по названию сервиса
+VIDEO_DOWNLOAD_TASKS = {
+    "youtube": download_youtube_video,
+    "reddit": download_reddit_video,
+    "rutube": download_rutube_video,
+    "tiktok": download_tiktok_video,
+}
+
+
+async def _enqueue(task, **kwargs) -> None:
+    """Публикует Celery задачу в пуле потоков, не блокируя цикл событий."""
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, partial(task.delay, **kwargs))
 
 
 class ServiceCallbackHandler:
@@ -16,13 +39,6 @@ class ServiceCallbackHandler:
             )
             return
 
-        from src.tasks.downloads_worker import (
-            download_reddit_video, 
-            download_rutube_video, 
-            download_tiktok_video, 
-            download_youtube_video,
-        )
-        
         session = user_session_storage.get_session(chat_id=callback.message.chat.id)
         if session is None:
             await callback.answer(
@@ -32,7 +48,13 @@ class ServiceCallbackHandler:
             return
             
         content_type, video_id = callback.data.split(":")
-        video = [v for v in session["media_data"]["videos"] if v["id"] == video_id][0]
+        video = session["media_data"].get("videos_by_id", {}).get(video_id)
+        if video is None:
+            await callback.answer(
+                "❌ Сессия устарела. Пожалуйста, отправьте ссылку заново.",
+                show_alert=True
+            )
+            return
         
         url = session["url"]
         width = video.get("width")
@@ -60,15 +82,10 @@ class ServiceCallbackHandler:
         
         else:
             # Для остальных сервисов используем Celery для асинхронной загрузки
-            task_map = {
-                "youtube": download_youtube_video,
-                "reddit": download_reddit_video,
-                "rutube": download_rutube_video,
-                "tiktok": download_tiktok_video,
-            }
-            task = task_map.get(session["service"])
+            task = VIDEO_DOWNLOAD_TASKS.get(session["service"])
             if task:
-                task.delay(
+                await _enqueue(
+                    task,
                     url=url,
                     width=width,
                     height=height,
@@ -91,31 +108,21 @@ class ServiceCallbackHandler:
             )
             return
         
-        images_by_width: Dict[int, List[AbstractServiceImageTypeDict]] = {}
-        for image in session["media_data"]["images"]:
-            width = image["width"]
-            if width not in images_by_width:
-                images_by_width[width] = []
-            images_by_width[width].append(image)
+        # Изображения лучшего качества выбраны при создании сессии
+        best_images = session["media_data"].get("best_images", [])
         
-        # Берем лучшее качество (максимальную ширину)
-        max_quality = max(images_by_width.keys()) if images_by_width else 0
-        best_images = images_by_width.get(max_quality, [])
-        
-        # Создаем медиа группу с красивыми подписями
-        media = []
-        for i, image in enumerate(best_images):
-            caption = ""
-            if i == 0:
-                service_name = session.get("service", "unknown").title()
-                caption = f"🖼️ **Галерея {service_name}**\n\n" \
-                          f"🖼️ **Количество:** {len(best_images)} шт.\n"
-            
-            media.append(InputMediaPhoto(
+        # Создаем медиа группу, подпись только у первого изображения
+        service_name = session.get("service", "unknown").title()
+        first_caption = f"🖼️ **Галерея {service_name}**\n\n" \
+                        f"🖼️ **Количество:** {len(best_images)} шт.\n"
+        media = [
+            InputMediaPhoto(
                 media=image["url"],
-                caption=caption,
+                caption=first_caption if i == 0 else "",
                 parse_mode="Markdown"
-            ))
+            )
+            for i, image in enumerate(best_images)
+        ]
         
         await callback.message.answer_media_group(
             media=media
@@ -124,7 +131,6 @@ class ServiceCallbackHandler:
         
     @staticmethod
     async def handle_audio(callback: CallbackQuery) -> None:
-        from src.tasks.downloads_worker import download_audio
         if user_activity_queue.get_download(chat_id=callback.message.chat.id):
             await callback.answer(
                 "⏳ Уже скачиваю предыдущий файл. Дождитесь окончания загрузки.",
@@ -140,17 +146,24 @@ class ServiceCallbackHandler:
             )
             return
         
+        content_type, audio_id = callback.data.split(":")
+        audio = session["media_data"].get("audios_by_id", {}).get(audio_id)
+        if audio is None:
+            await callback.answer(
+                "❌ Сессия устарела. Пожалуйста, отправьте ссылку заново.",
+                show_alert=True
+            )
+            return
+        
         user_activity_queue.create_download(
             url=session["url"],
             chat_id=callback.message.chat.id,
             service=session["service"],
         )
-        
-        content_type, audio_id = callback.data.split(":")
-        audio = [a for a in session["media_data"]["audios"] if a["id"] == audio_id][0]
 
         if audio["name"] == "music":
-            download_audio.delay(
+            await _enqueue(
+                download_audio,
                 direct=True,
                 url=audio["url"],
                 audio_id=audio["name"],
@@ -160,7 +173,8 @@ class ServiceCallbackHandler:
             )
             
         else:
-            download_audio.delay(
+            await _enqueue(
+                download_audio,
                 url=session["url"],
                 audio_id=audio["name"],
                 service=session["service"], 
@@ -181,7 +195,13 @@ class ServiceCallbackHandler:
             return
         
         content_type, thumbnail_id = callback.data.split(":")
-        thumbnail = [t for t in session["media_data"]["thumbnails"] if t["id"] == thumbnail_id][0]
+        thumbnail = session["media_data"].get("thumbnails_by_id", {}).get(thumbnail_id)
+        if thumbnail is None:
+            await callback.answer(
+                "❌ Сессия устарела. Пожалуйста, отправьте ссылку заново.",
+                show_alert=True
+            )
+            return
         
         await callback.message.answer_photo(
             photo=thumbnail["url"],
@@ -1,12 +1,28 @@
-from enum import Enum
+from enum import StrEnum
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
 
 
-class ServiceType(Enum):
+# Ответ пользователю при ошибке обработки ссылки
+URL_ERROR_TEXT = (
+    "❌ <b>Произошла ошибка при обработке ссылки</b>\n\n"
+    "Возможные причины:\n"
+    "• Ссылка недействительна\n"
+    "• Контент недоступен\n"
+    "• Временные проблемы с сервисом\n\n"
+    "Попробуйте позже или проверьте корректность ссылки."
+)
+
+
+class ServiceType(StrEnum):
     """
     Перечисление типов поддерживаемых сервисов.
     
     Используется для идентификации типа сервиса по домену URL
-    и соответствующей обработки контента.
+    и соответствующей обработки контента. Члены являются строками,
+    поэтому хэширование и сравнение выполняются на уровне str,
+    а значение совпадает с названием сервиса в задачах и сессиях.
     
     Examples:
         >>> ServiceType.YOUTUBE
@@ -17,6 +33,9 @@ class ServiceType(Enum):
         
         >>> ServiceType('youtube')
         <ServiceType.YOUTUBE: 'youtube'>
+        
+        >>> ServiceType.YOUTUBE == 'youtube'
+        True
     """
     
     YOUTUBE = "youtube"
@@ -36,3 +55,29 @@ class ServiceType(Enum):
     
     UNSUPPORTED = "unsupported"
     """Неподдерживаемый сервис."""
+
+
+@dataclass(slots=True, frozen=True)
+class ServiceDescriptor:
+    """
+    Неизменяемое описание поддерживаемого сервиса.
+    
+    Связывает тип сервиса с названием, под которым он передается
+    в задачи Celery, чтобы при обработке сообщения не выполнять
+    дополнительных поисков по строкам.
+    
+    Attributes:
+        service_type (ServiceType): Тип сервиса
+        celery_name (str): Название сервиса в задачах get_media_info
+    """
+    
+    service_type: ServiceType
+    celery_name: str
+
+
+# Описания всех поддерживаемых сервисов (ServiceType.UNSUPPORTED не входит)
+SERVICE_DESCRIPTORS: Mapping[ServiceType, ServiceDescriptor] = MappingProxyType({
+    service_type: ServiceDescriptor(service_type=service_type, celery_name=service_type.value)
+    for service_type in ServiceType
+    if service_type is not ServiceType.UNSUPPORTED
+})
@@ -1,8 +1,46 @@
-from urllib.parse import urlparse
+from typing import Any, Dict, Optional, Tuple, Union
+from functools import lru_cache
 
 from aiogram.types import Message
 from aiogram.filters import BaseFilter
 
+from .common import SERVICE_DESCRIPTORS, ServiceDescriptor, ServiceType
+from .patterns import DomainMatcher, host_of
+
+
+# Домен, тип сервиса и описание сервиса (None для неподдерживаемых доменов)
+ClassifiedURL = Tuple[str, ServiceType, Optional[ServiceDescriptor]]
+
+
+@lru_cache(maxsize=4096)
+def _classify_url(text: str) -> Optional[ClassifiedURL]:
+    """
+    Извлекает домен из URL и определяет тип сервиса с кэшированием.
+    
+    Args:
+        text (str): URL без начальных и конечных пробелов.
+        
+    Returns:
+        Optional[ClassifiedURL]: Домен, тип сервиса
+            (ServiceType.UNSUPPORTED для неподдерживаемых доменов)
+            и описание сервиса, или None, если текст не является
+            http/https ссылкой.
+        
+    Notes:
+        Пользователи часто пересылают одни и те же ссылки, поэтому
+        повторные проверки обслуживаются из кэша. Кэш сбрасывается
+        автоматически при DomainMatcher.add_custom_domain.
+    """
+    domain = host_of(text)
+    if not domain:
+        return None
+    
+    _, service_type = DomainMatcher.classify(domain)
+    return domain, service_type, SERVICE_DESCRIPTORS.get(service_type)
+
+
+DomainMatcher.register_cache_invalidation(_classify_url.cache_clear)
+
 
 class URLFilter(BaseFilter):
     """
@@ -38,7 +76,7 @@ class URLFilter(BaseFilter):
         """
         self.check_support = check_support
     
-    async def __call__(self, message: Message) -> bool:
+    async def __call__(self, message: Message) -> Union[bool, Dict[str, Any]]:
         """
         Вызывается при проверке сообщения фильтром.
         
@@ -46,18 +84,55 @@ class URLFilter(BaseFilter):
             message (Message): Объект сообщения от пользователя.
             
         Returns:
-            bool: True если сообщение содержит валидный URL, 
-                False в противном случае.
+            Union[bool, Dict[str, Any]]: Словарь с ключами url (текст без
+                пробелов), domain, service_type и service (ServiceDescriptor
+                или None), который aiogram передает в обработчик, если
+                сообщение содержит валидный URL, иначе False.
                 
         Notes:
             Проверяет как текст сообщения, так и подпись к медиафайлу.
             Пустые сообщения или сообщения без URL сразу возвращают False.
         """
-        text = message.text or message.caption or ""
-        if not text.strip():
+        text = message.text
+        if text is None:
+            text = message.caption
+            if text is None:
+                return False
+        
+        text = text.strip()
+        if not text:
             return False
         
-        return self.is_valid_url(text)
+        classified = self._classify(text)
+        if classified is None:
+            return False
+        
+        domain, service_type, service = classified
+        return {"url": text, "domain": domain, "service_type": service_type, "service": service}
+    
+    def _classify(self, text: str) -> Optional[ClassifiedURL]:
+        """
+        Классифицирует URL с учетом флага check_support.
+        
+        Args:
+            text (str): URL без начальных и конечных пробелов.
+            
+        Returns:
+            Optional[ClassifiedURL]: Домен, тип и описание сервиса или None,
+                если URL невалиден либо (при check_support=True) не поддерживается.
+        """
+        try:
+            classified = _classify_url(text)
+        except Exception:
+            return None
+        
+        if classified is None:
+            return None
+        
+        if self.check_support and classified[1] is ServiceType.UNSUPPORTED:
+            return None
+        
+        return classified
     
     def is_valid_url(self, text: str) -> bool:
         """
@@ -74,24 +149,9 @@ class URLFilter(BaseFilter):
             Ловит все исключения и возвращает False в случае ошибок.
             
         Steps:
-            1. Парсит URL с помощью urlparse
+            1. Извлекает домен из URL (результат кэшируется)
             2. Проверяет наличие схемы (http/https) и домена
             3. При check_support=True проверяет домен через DomainMatcher
             4. Возвращает результат проверки
         """
-        try:
-            parsed = urlparse(text.strip())
-            if not (parsed.scheme in ('http', 'https') and parsed.netloc):
-                return False
-            
-            domain = parsed.netloc.lower()
-            
-            # Если требуется проверка поддержки домена
-            if self.check_support:
-                from src.app.patterns import DomainMatcher
-                return DomainMatcher.is_domain_supported(domain)
-            
-            return True
-            
-        except Exception:
-            return False
+        return self._classify(text.strip()) is not None
@@ -1,60 +1,187 @@
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
 from aiogram.types import Message
 
+from .common import URL_ERROR_TEXT, ServiceDescriptor
+from src.tasks.app import app as celery_app
+from src.tasks.information_worker import get_media_info
 
-class ServiceHandler:
-    """Базовый класс для обработки конкретных сервисов."""
+
+logger = logging.getLogger(__name__)
+
+# Аргументы задачи, исходное сообщение и обработчик неудачной публикации
+QueuedTask = Tuple[Dict[str, Any], Message, Optional[Callable[[], None]]]
+
+
+class MediaInfoBatcher:
+    """
+    Объединяет публикации задачи get_media_info в пачки.
     
-    @staticmethod
-    async def handle_youtube(url: str, message: Message, domain: str) -> None:
-        """Обработчик YouTube."""
-        from src.tasks.information_worker import get_media_info
-        get_media_info.delay(
-            url=url,
-            service="youtube",
-            chat_id=message.chat.id,
-            message_id=message.message_id,
-        )
+    Полезные нагрузки складываются в asyncio.Queue, а фоновая задача
+    публикует все накопившиеся элементы (до max_batch за раз) через один
+    producer из пула Celery. Пока одна пачка публикуется в пуле потоков,
+    следующие сообщения накапливаются в очереди, поэтому при всплесках
+    (альбомы, пересланные подборки) брокер получает одну серию отправок
+    по одному соединению вместо отдельного round-trip на каждое сообщение.
     
-    @staticmethod
-    async def handle_instagram(url: str, message: Message, domain: str) -> None:
-        """Обработчик Instagram."""
-        from src.tasks.information_worker import get_media_info
-        get_media_info.delay(
-            url=url,
-            service="instagram",
-            chat_id=message.chat.id,
-            message_id=message.message_id,
-        )
+    Вместе с каждой задачей хранится исходное сообщение: если пачку не
+    удалось опубликовать и после повтора, каждому затронутому чату
+    отправляется URL_ERROR_TEXT, а переданный on_failure вызывается,
+    чтобы повторная отправка ссылки не считалась дублем.
+    """
     
-    @staticmethod
-    async def handle_reddit(url: str, message: Message, domain: str) -> None:
-        """Обработчик Reddit."""
-        from src.tasks.information_worker import get_media_info
-        get_media_info.delay(
-            url=url,
-            service="reddit",
-            chat_id=message.chat.id,
-            message_id=message.message_id,
+    def __init__(self, max_batch: int = 16, publish_attempts: int = 2) -> None:
+        """
+        Args:
+            max_batch: Максимальное количество задач в одной пачке
+            publish_attempts: Количество попыток публикации пачки
+        """
+        self.max_batch = max_batch
+        self.publish_attempts = publish_attempts
+        # Очередь создается один раз: при перезапуске фоновой задачи
+        # накопившиеся элементы не теряются
+        self._queue: asyncio.Queue[QueuedTask] = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+    
+    def enqueue(
+        self,
+        payload: Dict[str, Any],
+        message: Message,
+        on_failure: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Добавить задачу в очередь на публикацию.
+        
+        Метод синхронный: очередь не ограничена, поэтому ожидать нечего.
+        Вызывается из кода, выполняющегося в цикле событий.
+        
+        Args:
+            payload: Аргументы задачи get_media_info
+            message: Сообщение пользователя, на которое отвечать при ошибке
+            on_failure: Вызывается, если задачу не удалось опубликовать
+        """
+        self._queue.put_nowait((payload, message, on_failure))
+        self._ensure_worker()
+    
+    def _ensure_worker(self) -> None:
+        """Запустить (или перезапустить) фоновую задачу на той же очереди."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+    
+    async def close(self, timeout: float = 10.0) -> None:
+        """
+        Опубликовать накопившиеся задачи и остановить фоновую задачу.
+        
+        Args:
+            timeout: Максимальное время ожидания публикации в секундах
+        """
+        if not self._queue.empty():
+            self._ensure_worker()
+        
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Не все задачи get_media_info опубликованы при остановке: осталось %s",
+                self._queue.qsize()
+            )
+        
+        if self._worker is not None:
+            self._worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+    
+    async def _run(self) -> None:
+        """Фоновый цикл: забирает накопившиеся задачи и публикует их пачкой."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            try:
+                await self._publish_batch(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    
+    async def _publish_batch(self, batch: List[QueuedTask]) -> None:
+        """Опубликовать пачку с повтором; при неудаче сообщить об ошибке каждому чату."""
+        loop = asyncio.get_running_loop()
+        # _publish удаляет опубликованные элементы, поэтому повтор
+        # отправляет только оставшиеся задачи без дублей
+        pending = list(batch)
+        
+        for attempt in range(1, self.publish_attempts + 1):
+            try:
+                await loop.run_in_executor(None, self._publish, pending)
+                return
+            except Exception as e:
+                logger.error(
+                    "Не удалось опубликовать %s задач get_media_info (попытка %s/%s): %s",
+                    len(pending), attempt, self.publish_attempts, e
+                )
+        
+        for _, _, on_failure in pending:
+            if on_failure is not None:
+                on_failure()
+        
+        results = await asyncio.gather(
+            *(message.answer(URL_ERROR_TEXT) for _, message, _ in pending),
+            return_exceptions=True
         )
+        for (payload, _, _), result in zip(pending, results):
+            if isinstance(result, Exception):
+                logger.error("Не удалось уведомить чат %s об ошибке: %s", payload["chat_id"], result)
     
     @staticmethod
-    async def handle_rutube(url: str, message: Message, domain: str) -> None:
-        """Обработчик Rutube."""
-        from src.tasks.information_worker import get_media_info
-        get_media_info.delay(
-            url=url,
-            service="rutube",
-            chat_id=message.chat.id,
-            message_id=message.message_id,
-        )
+    def _publish(pending: List[QueuedTask]) -> None:
+        """
+        Опубликовать пачку задач через один producer (выполняется в пуле потоков).
+        
+        Опубликованные элементы удаляются из начала pending, так что при
+        исключении в списке остаются только неотправленные задачи.
+        """
+        published = 0
+        try:
+            with celery_app.producer_pool.acquire(block=True) as producer:
+                for payload, _, _ in pending:
+                    get_media_info.apply_async(kwargs=payload, producer=producer)
+                    published += 1
+        finally:
+            del pending[:published]
+        logger.debug("Опубликовано задач get_media_info: %s", published)
+
+
+media_info_batcher = MediaInfoBatcher()
+
+
+class ServiceHandler:
+    """Обработка ссылок поддерживаемых сервисов."""
     
     @staticmethod
-    async def handle_tiktok(url: str, message: Message, domain: str) -> None:
-        """Обработчик TikTok."""
-        from src.tasks.information_worker import get_media_info
-        get_media_info.delay(
-            url=url,
-            service="tiktok",
-            chat_id=message.chat.id,
-            message_id=message.message_id,
-        )
+    def dispatch(
+        service: ServiceDescriptor,
+        url: str,
+        message: Message,
+        on_failure: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Поставить задачу получения информации о медиа для сервиса (без ожидания).
+        
+        Args:
+            service: Описание сервиса
+            url: Ссылка из сообщения
+            message: Сообщение пользователя
+            on_failure: Вызывается, если задачу не удалось опубликовать
+        """
+        media_info_batcher.enqueue({
+            "url": url,
+            "service": service.celery_name,
+            "chat_id": message.chat.id,
+            "message_id": message.message_id,
+        }, message, on_failure)
@@ -0,0 +1,104 @@
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from aiogram import BaseMiddleware
+from aiogram.types import Message
+
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_URL_TEXT = "⏳ Эта ссылка уже обрабатывается, результат придет в ближайшее время."
+
+
+class DuplicateURLMiddleware(BaseMiddleware):
+    """
+    Middleware для отбрасывания повторных ссылок.
+    
+    Если пользователь в течение ttl секунд повторно отправляет в тот же чат
+    ту же ссылку (двойное нажатие, повторная отправка клиентом), сообщение
+    не обрабатывается и задача get_media_info не ставится в очередь,
+    а пользователь получает короткий ответ, что ссылка уже обрабатывается.
+    
+    Если обработчик завершился исключением или задачу не удалось
+    опубликовать (обработчик получает функцию release_url), запись
+    удаляется, и повторная отправка ссылки обрабатывается заново.
+    
+    Регистрируется как внутренний middleware роутера ссылок, поэтому
+    получает url, уже вычисленный URLFilter.
+    
+    Attributes:
+        ttl (float): Время в секундах, в течение которого ссылка считается повторной
+        maxsize (int): Максимальное количество запоминаемых пар (чат, ссылка)
+    """
+    
+    def __init__(self, ttl: float = 30.0, maxsize: int = 10_000) -> None:
+        """
+        Args:
+            ttl: Время в секундах, в течение которого ссылка считается повторной
+            maxsize: Максимальное количество запоминаемых пар (чат, ссылка)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # Время истечения по ключу; TTL одинаковый, поэтому порядок вставки
+        # совпадает с порядком истечения и устаревшие записи всегда в начале
+        self._seen: OrderedDict[Hashable, float] = OrderedDict()
+    
+    async def __call__(
+        self,
+        handler: Callable[[Message, Dict[str, Any]], Awaitable[Any]],
+        event: Message,
+        data: Dict[str, Any],
+    ) -> Any:
+        """
+        Пропустить сообщение в обработчик, если ссылка не повторная.
+        
+        Args:
+            handler: Следующий обработчик в цепочке
+            event: Сообщение пользователя
+            data: Данные, переданные фильтрами (содержит url)
+            
+        Returns:
+            Any: Результат обработчика или None для повторной ссылки
+        """
+        now = time.monotonic()
+        self._evict_expired(now)
+        
+        key = (event.chat.id, data["url"])
+        if key in self._seen:
+            logger.info(f"🔁 Повторная ссылка в чате {event.chat.id} пропущена: {data['url']}")
+            await event.answer(DUPLICATE_URL_TEXT)
+            return None
+        
+        # Ключ записывается до вызова обработчика, чтобы одновременные
+        # повторы тоже отбрасывались; при ошибке он удаляется
+        expires_at = now + self.ttl
+        self._seen[key] = expires_at
+        if len(self._seen) > self.maxsize:
+            self._seen.popitem(last=False)
+        
+        data["release_url"] = lambda: self._release(key, expires_at)
+        try:
+            return await handler(event, data)
+        except Exception:
+            self._release(key, expires_at)
+            raise
+    
+    def _release(self, key: Hashable, expires_at: float) -> None:
+        """
+        Забыть пару (чат, ссылка), чтобы повторная отправка обработалась.
+        
+        Запись удаляется, только если она не была заменена более новой.
+        """
+        if self._seen.get(key) == expires_at:
+            del self._seen[key]
+    
+    def _evict_expired(self, now: float) -> None:
+        """Удалить записи с истекшим временем жизни."""
+        seen = self._seen
+        while seen:
+            key, expires_at = next(iter(seen.items()))
+            if expires_at > now:
+                break
+            del seen[key]
@@ -1,3 +1,6 @@
+from importlib import import_module
+from typing import Any
+
 from .abstractions import (
     AbstractServiceResultTypeDict,
     AbstractServiceAudioTypeDict,
@@ -13,56 +16,47 @@ from .abstractions import (
     AbstractServiceData,
 )
 
-from .youtube import (
-    YoutubeDownloader,
-    YoutubeErrorCode,
-    YoutubeResult,
-    YoutubeVideo,
-    YoutubeImage,
-    YoutubeAudio,
-    YoutubeData,
-)
 
-from .rutube import (
-    RutubeDownloader,
-    RutubeErrorCode,
-    RutubeResult,
-    RutubeVideo,
-    RutubeImage,
-    RutubeAudio,
-    RutubeData,
-)
+# Префиксы классов каждого сервиса: модуль импортируется только при первом
+# обращении к одному из его символов (PEP 562), чтобы воркер, обрабатывающий
+# один сервис, не загружал yt-dlp, instaloader, praw и gallery-dl целиком.
+_SERVICES = {
+    "youtube": "Youtube",
+    "rutube": "Rutube",
+    "instagram": "Instagram",
+    "tiktok": "TikTok",
+    "reddit": "Reddit",
+}
 
-from .instagram import (
-    InstagramDownloader,
-    InstagramErrorCode,
-    InstagramResult,
-    InstagramVideo,
-    InstagramAudio,
-    InstagramImage,
-    InstagramData,
+_SERVICE_SUFFIXES = (
+    "Downloader",
+    "ErrorCode",
+    "Result",
+    "Video",
+    "Audio",
+    "Image",
+    "Data",
 )
 
-from .tiktok import (
-    TikTokDownloader,
-    TikTokErrorCode,
-    TikTokResult,
-    TikTokVideo,
-    TikTokAudio,
-    TikTokImage,
-    TikTokData,
+_LAZY = {
+    prefix + suffix: module
+    for module, prefix in _SERVICES.items()
+    for suffix in _SERVICE_SUFFIXES
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
     
-)
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
 
-from .reddit import (
-    RedditDownloader,
-    RedditErrorCode,
-    RedditResult,
-    RedditVideo,
-    RedditAudio,
-    RedditImage,
-    RedditData,
-)
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY))
 
 
 __all__ = [
@@ -80,48 +74,6 @@ __all__ = [
     "AbstractServiceImage",
     "AbstractServiceData",
     
-    # youtube
-    "YoutubeDownloader",
-    "YoutubeErrorCode",
-    "YoutubeResult",
-    "YoutubeVideo",
-    "YoutubeAudio",
-    "YoutubeImage",
-    "YoutubeData",
-    
-    # rutube
-    "RutubeDownloader",
-    "RutubeErrorCode",
-    "RutubeResult",
-    "RutubeVideo",
-    "RutubeImage",
-    "RutubeAudio",
-    "RutubeData",
-    
-    # instagram
-    "InstagramDownloader",
-    "InstagramErrorCode",
-    "InstagramResult",
-    "InstagramVideo",
-    "InstagramAudio",
-    "InstagramImage",
-    "InstagramData",
-    
-    # tiktok
-    "TikTokDownloader",
-    "TikTokErrorCode",
-    "TikTokResult",
-    "TikTokVideo",
-    "TikTokAudio",
-    "TikTokImage",
-    "TikTokData",
-    
-    # reddit
-    "RedditDownloader",
-    "RedditErrorCode",
-    "RedditResult",
-    "RedditVideo",
-    "RedditAudio",
-    "RedditImage",
-    "RedditData",
+    # youtube, rutube, instagram, tiktok, reddit
+    *_LAZY,
 ]
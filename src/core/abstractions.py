@@ -1,10 +1,46 @@
-from enum import Enum
+import os
+from enum import StrEnum
+from uuid import uuid4
 from pathlib import Path
+from itertools import count
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Literal, Optional, TypedDict, NotRequired
 
 
+# Идентификаторы медиа: старшие 64 бита случайны и выбираются один раз на процесс,
+# младшие берутся из счётчика. uuid4() читает /dev/urandom на каждый вызов
+_MEDIA_ID_PREFIX = str(uuid4())[:19]
+_media_id_counter = count()
+
+
+def _reseed_media_ids() -> None:
+    """Выбрать новый префикс идентификаторов в дочернем процессе после fork."""
+    global _MEDIA_ID_PREFIX, _media_id_counter
+    _MEDIA_ID_PREFIX = str(uuid4())[:19]
+    _media_id_counter = count()
+
+
+# Дочерние процессы prefork-пула Celery наследуют префикс и счётчик родителя,
+# поэтому без пересева разные воркеры выдавали бы одинаковые последовательности
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_media_ids)
+
+
+def new_media_id() -> str:
+    """
+    Уникальный идентификатор медиа в формате str(UUID).
+    
+    Уникальность между процессами обеспечивает случайный префикс,
+    который выбирается заново в каждом процессе (включая fork).
+    
+    Возвращает:
+        Строку вида xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx
+    """
+    n = next(_media_id_counter)
+    return f"{_MEDIA_ID_PREFIX}{n >> 48 & 0xFFFF:04x}-{n & 0xFFFFFFFFFFFF:012x}"
+
+
 # ======= Image =======
 class AbstractServiceImageTypeDict(TypedDict):
     id: str
@@ -14,8 +50,8 @@ class AbstractServiceImageTypeDict(TypedDict):
     height: NotRequired[Optional[int]]
 
 
-@dataclass
-class AbstractServiceImage(ABC):
+@dataclass(slots=True, frozen=True, eq=False, match_args=False)
+class AbstractServiceImage:
     """
     Базовый абстрактный класс, описывающий изображение в сервисе.
     
@@ -32,20 +68,26 @@ class AbstractServiceImage(ABC):
     width: Optional[int] = None
     height: Optional[int] = None
     
+    def __post_init__(self) -> None:
+        """Нестроковый идентификатор (например, UUID) приводится к строке один раз при создании."""
+        if not isinstance(self.id, str):
+            object.__setattr__(self, "id", str(self.id))
+    
     def to_dict(self) -> AbstractServiceImageTypeDict:
         """
         Преобразует объект изображения в словарь.
         
+        Необязательные поля со значением None в словарь не попадают.
+        
         Возвращает:
-            Словарь со всеми атрибутами изображения
+            Словарь с заполненными атрибутами изображения
         """
-        return {
-            "id": str(self.id),
-            "url": self.url,
-            "name": self.name,
-            "width": self.width,
-            "height": self.height,
-        }
+        data = {"id": self.id, "url": self.url, "name": self.name}
+        if self.width is not None:
+            data["width"] = self.width
+        if self.height is not None:
+            data["height"] = self.height
+        return data
     
 
 # ======= Video ======= 
@@ -62,8 +104,8 @@ class AbstractServiceVideoTypeDict(TypedDict):
     language_preference: NotRequired[Optional[int]]
 
 
-@dataclass
-class AbstractServiceVideo(ABC):
+@dataclass(slots=True, frozen=True, eq=False, match_args=False)
+class AbstractServiceVideo:
     """
     Базовый абстрактный класс, описывающий видео в сервисе.
     
@@ -90,25 +132,34 @@ class AbstractServiceVideo(ABC):
     total_bitrate: Optional[int] = None
     language_preference: Optional[int] = None
     
+    def __post_init__(self) -> None:
+        """Нестроковый идентификатор (например, UUID) приводится к строке один раз при создании."""
+        if not isinstance(self.id, str):
+            object.__setattr__(self, "id", str(self.id))
+    
     def to_dict(self) -> AbstractServiceVideoTypeDict:
         """
         Преобразует объект видео в словарь.
         
+        Необязательные поля со значением None в словарь не попадают.
+        
         Возвращает:
-            Словарь со всеми атрибутами видео
+            Словарь с заполненными атрибутами видео
         """
-        return {
-            "id": str(self.id),
-            "url": self.url,
-            "name": self.name,
-            "has_audio": self.has_audio, 
-            "fps": self.fps,
-            "width": self.width,
-            "height": self.height,
-            "language": self.language,
-            "total_bitrate": self.total_bitrate,
-            "language_preference": self.language_preference,
-        }
+        data = {"id": self.id, "url": self.url, "name": self.name, "has_audio": self.has_audio}
+        if self.fps is not None:
+            data["fps"] = self.fps
+        if self.width is not None:
+            data["width"] = self.width
+        if self.height is not None:
+            data["height"] = self.height
+        if self.language is not None:
+            data["language"] = self.language
+        if self.total_bitrate is not None:
+            data["total_bitrate"] = self.total_bitrate
+        if self.language_preference is not None:
+            data["language_preference"] = self.language_preference
+        return data
     
 
 # ======= Audio =======
@@ -122,8 +173,8 @@ class AbstractServiceAudioTypeDict(TypedDict):
     language_preference: NotRequired[Optional[int]]
 
 
-@dataclass
-class AbstractServiceAudio(ABC):
+@dataclass(slots=True, frozen=True, eq=False, match_args=False)
+class AbstractServiceAudio:
     """
     Базовый абстрактный класс, описывающий аудиофайл в сервисе.
     
@@ -144,24 +195,32 @@ class AbstractServiceAudio(ABC):
     total_bitrate: Optional[int] = None
     language_preference: Optional[int] = None
     
+    def __post_init__(self) -> None:
+        """Нестроковый идентификатор (например, UUID) приводится к строке один раз при создании."""
+        if not isinstance(self.id, str):
+            object.__setattr__(self, "id", str(self.id))
+    
     def to_dict(self) -> AbstractServiceAudioTypeDict:
         """
         Преобразует объект аудио в словарь.
         
+        Необязательные поля со значением None в словарь не попадают.
+        
         Возвращает:
-            Словарь со всеми атрибутами аудио
+            Словарь с заполненными атрибутами аудио
         """
-        return {
-            "id": str(self.id),
-            "url": self.url,
-            "name": self.name,
-            "author": self.author,
-            "language": self.language,
-            "total_bitrate": self.total_bitrate,
-            "language_preference": self.language_preference,
-        }
-        
+        data = {"id": self.id, "url": self.url, "name": self.name}
+        if self.author is not None:
+            data["author"] = self.author
+        if self.language is not None:
+            data["language"] = self.language
+        if self.total_bitrate is not None:
+            data["total_bitrate"] = self.total_bitrate
+        if self.language_preference is not None:
+            data["language_preference"] = self.language_preference
+        return data
     
+
 # ======= Data =======
 class AbstractServiceDataTypeDict(TypedDict):
     url: str
@@ -177,8 +236,8 @@ class AbstractServiceDataTypeDict(TypedDict):
     thumbnails: List[AbstractServiceImageTypeDict]
     
 
-@dataclass
-class AbstractServiceData(ABC):
+@dataclass(slots=True, eq=False, match_args=False)
+class AbstractServiceData:
     """
     Базовый абстрактный класс, представляющий данные, собранные из сервиса.
     
@@ -207,34 +266,48 @@ class AbstractServiceData(ABC):
     audios: List[AbstractServiceAudio] = field(default_factory=list)
     thumbnails: List[AbstractServiceImage] = field(default_factory=list)
     
+    def __post_init__(self) -> None:
+        """Загрузчики передают путь как Path; строка вычисляется один раз при создании."""
+        if self.path is not None and not isinstance(self.path, str):
+            self.path = str(self.path)
+    
     def to_dict(self) -> AbstractServiceDataTypeDict:
         """
         Преобразует объект данных в словарь.
         
+        Необязательные поля со значением None в словарь не попадают;
+        списки медиа присутствуют всегда.
+        
         Возвращает:
-            Словарь со всеми атрибутами данных (вложенные объекты также преобразуются в словари)
+            Словарь с заполненными атрибутами данных (вложенные объекты также преобразуются в словари)
         """
-        return {
+        data = {
             "url": self.url,
-            "author_name": self.author_name,
             "is_video": self.is_video,
             "is_image": self.is_image,
-            "path": self.path,
-            "title": self.title,
-            "description": self.description,
             "videos": [video.to_dict() for video in self.videos],
             "images": [image.to_dict() for image in self.images],
             "audios": [audio.to_dict() for audio in self.audios],
             "thumbnails": [thumbnail.to_dict() for thumbnail in self.thumbnails],
         }
+        if self.path is not None:
+            data["path"] = self.path
+        if self.title is not None:
+            data["title"] = self.title
+        if self.author_name is not None:
+            data["author_name"] = self.author_name
+        if self.description is not None:
+            data["description"] = self.description
+        return data
 
 
-class AbstractServiceErrorCode(Enum):
+class AbstractServiceErrorCode(StrEnum):
     """
     Базовый класс для кодов ошибок сервиса.
     
     Этот enum должен быть расширен конкретными реализациями сервисов,
-    чтобы задавать свои собственные коды ошибок.
+    чтобы задавать свои собственные коды ошибок. Члены являются строками,
+    поэтому код передается в to_dict без обращения к .value.
     """
     SUCCESS = "SUCCESS"
     UNEXPECTED_ERROR = "UNEXPECTED_ERROR"
@@ -248,8 +321,8 @@ class AbstractServiceResultTypeDict(TypedDict):
     data: NotRequired[Optional[AbstractServiceDataTypeDict]]
 
 
-@dataclass
-class AbstractServiceResult(ABC):
+@dataclass(slots=True, eq=False, match_args=False)
+class AbstractServiceResult:
     """
     Базовый абстрактный класс, представляющий результат выполнения операции сервиса.
     
@@ -268,15 +341,19 @@ class AbstractServiceResult(ABC):
         """
         Преобразует объект результата в словарь.
         
+        Контекст и данные добавляются, только если они заданы
+        (у результатов с ошибкой данных нет).
+        
         Возвращает:
-            Словарь со статусом, контекстом, кодом и данными
+            Словарь со статусом, кодом и, при наличии, контекстом и данными
         """
-        return {
-            "status": self.status,
-            "context": self.context,
-            "code": self.code.value,
-            "data": self.data.to_dict(),
-        }
+        # Коды ошибок — StrEnum, член перечисления уже является строкой
+        result = {"status": self.status, "code": self.code}
+        if self.context is not None:
+            result["context"] = self.context
+        if self.data is not None:
+            result["data"] = self.data.to_dict()
+        return result
 
 
 class AbstractServiceDownloader(ABC):
@@ -5,18 +5,24 @@
 из Instagram, включая изображения, видео и карусельные публикации.
 """
 
+import os
+import re
 import logging
-from enum import Enum
-from uuid import uuid4
-from pathlib import Path
-from typing import Optional
-from urllib.parse import urlparse
+from threading import Lock, Thread
+from copy import deepcopy
+from types import MappingProxyType
+from time import monotonic
+from enum import Enum, StrEnum
+from typing import Dict, Optional, Protocol, Tuple
 from dataclasses import dataclass, field
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from instaloader import Post, Instaloader
 from instaloader.exceptions import (
     ConnectionException, 
     BadResponseException,
+    LoginRequiredException,
     PostChangedException,
     ProfileNotExistsException,
     QueryReturnedBadRequestException,
@@ -29,12 +35,48 @@ from .abstractions import (
     AbstractServiceImage,
     AbstractServiceResult,
     AbstractServiceDownloader, 
+    new_media_id,
 )
 
 
 # Настройка логирования
 logger = logging.getLogger("instagram")
 
+# Размер пула keep-alive соединений к хостам Instagram
+HTTP_POOL_SIZE = 32
+
+# Кэш результатов извлечения по shortcode: время жизни (сек) и размер
+POST_CACHE_TTL = 600
+POST_CACHE_SIZE = 512
+
+# Общая пустая заглушка для отсутствующих вложенных объектов ответа (только чтение)
+_EMPTY = MappingProxyType({})
+
+# Значения accessibility_caption, означающие отсутствие подписи
+_NO_CAPTION = (None, "", "None")
+
+# Shortcode из путей /p/, /tv/, /reel/, /reels/.
+# Если путь другой, он попадает во вторую группу для проверки короткой формы.
+_IG_PATH = r"(?:/(?:p|tv|reels?)/([A-Za-z0-9_-]+)|(/[^?#]*))?"
+_IG_PATH_RE = re.compile(_IG_PATH)
+
+# Хост *.instagram.com и путь за один проход
+_IG_URL_RE = re.compile(
+    r"^https?://(?:[\w-]+\.)*instagram\.com(?::\d+)?(?=[/?#]|$)" + _IG_PATH
+)
+
+# Частые начала ссылок: для них хост проверяется сравнением префикса
+_IG_PREFIXES = (
+    "https://www.instagram.com/",
+    "https://instagram.com/",
+    "http://www.instagram.com/",
+    "http://instagram.com/",
+    "https://m.instagram.com/",
+)
+
+# Короткая форма ссылки: instagram.com/<shortcode из 11 символов>
+_BARE_SHORTCODE_RE = re.compile(r"^/([A-Za-z0-9_-]{11})/?$")
+
 
 # ======= EnumsClasses =======
 class ContentType(Enum):
@@ -42,9 +84,16 @@ class ContentType(Enum):
     VIDEO = "GraphVideo"
     IMAGE = "GraphImage"
     SIDECAR = "GraphSidecar"
+
+
+# Значения ContentType для горячих циклов без обращения к Enum.
+# Сравнение остаётся через endswith: новые ответы API присылают "XDTGraphImage" и т.п.
+_TYPE_VIDEO = ContentType.VIDEO._value_
+_TYPE_IMAGE = ContentType.IMAGE._value_
+_TYPE_SIDECAR = ContentType.SIDECAR._value_
     
     
-class InstagramErrorCode(Enum):
+class InstagramErrorCode(StrEnum):
     """Коды ошибок, возникающих при работе с Instagram."""
     
     # Успех
@@ -78,32 +127,88 @@ class InstagramErrorCode(Enum):
     DOWNLOAD_ERROR = "DOWNLOAD_ERROR"        # Ошибка загрузки
     
 
+# Описания кодов ошибок: словарь строится один раз при импорте
+_ERROR_DESCRIPTIONS: Dict[str, str] = {
+    InstagramErrorCode.SUCCESS.value: "Операция выполнена успешно",
+    InstagramErrorCode.INVALID_URL.value: "Неправильный или неподдерживаемый URL",
+    InstagramErrorCode.INVALID_SHORTCODE.value: "Не удалось извлечь shortcode из URL",
+    InstagramErrorCode.EMPTY_URL.value: "Пустой или некорректный URL",
+    InstagramErrorCode.AUTHENTICATION_FAILED.value: "Ошибка аутентификации в Instagram",
+    InstagramErrorCode.SESSION_LOAD_FAILED.value: "Не удалось загрузить сессию из файла",
+    InstagramErrorCode.SESSION_SAVE_FAILED.value: "Не удалось сохранить сессию в файл",
+    InstagramErrorCode.CONNECTION_ERROR.value: "Ошибка сетевого соединения",
+    InstagramErrorCode.TIMEOUT_ERROR.value: "Превышено время ожидания запроса",
+    InstagramErrorCode.BAD_RESPONSE.value: "Некорректный ответ API Instagram",
+    InstagramErrorCode.POST_NOT_FOUND.value: "Пост не найден",
+    InstagramErrorCode.POST_CHANGED.value: "Пост изменён или недоступен",
+    InstagramErrorCode.PROFILE_NOT_EXISTS.value: "Профиль не существует",
+    InstagramErrorCode.CONTENT_NOT_SUPPORTED.value: "Тип контента не поддерживается",
+    InstagramErrorCode.EXTRACTION_ERROR.value: "Ошибка при извлечении контента",
+    InstagramErrorCode.UNEXPECTED_ERROR.value: "Произошла непредвиденная ошибка",
+    InstagramErrorCode.INITIALIZATION_ERROR.value: "Ошибка инициализации загрузчика",
+    InstagramErrorCode.DOWNLOAD_ERROR.value: "Ошибка при скачивании контента",
+}
+
+
+# Исключения Instaloader при извлечении -> (код ошибки, текст для сообщения)
+_EXCEPTION_CODES: Dict[type, Tuple[InstagramErrorCode, str]] = {
+    PostChangedException: (InstagramErrorCode.POST_CHANGED, "Пост изменён или недоступен"),
+    ProfileNotExistsException: (InstagramErrorCode.PROFILE_NOT_EXISTS, "Профиль не найден"),
+    ConnectionException: (InstagramErrorCode.CONNECTION_ERROR, "Ошибка соединения"),
+    BadResponseException: (InstagramErrorCode.BAD_RESPONSE, "Некорректный ответ API"),
+}
+_UNEXPECTED_EXCEPTION = (InstagramErrorCode.UNEXPECTED_ERROR, "Неожиданная ошибка при извлечении")
+
+
+def _classify_exception(exc: Exception) -> Tuple[InstagramErrorCode, str]:
+    """
+    Определение кода ошибки по типу исключения.
+    
+    Сначала проверяется точный тип, затем его MRO: подклассы вроде
+    TooManyRequestsException по-прежнему дают код родителя (CONNECTION_ERROR).
+    
+    Аргументы:
+        exc: Перехваченное исключение
+        
+    Возвращает:
+        Кортеж (код ошибки, текст для сообщения)
+    """
+    found = _EXCEPTION_CODES.get(type(exc))
+    if found is not None:
+        return found
+    for cls in type(exc).__mro__:
+        found = _EXCEPTION_CODES.get(cls)
+        if found is not None:
+            return found
+    return _UNEXPECTED_EXCEPTION
+
+
 # ======= DataClasses =======
-@dataclass
+@dataclass(slots=True, eq=False, match_args=False)
 class InstagramData(AbstractServiceData):
     """Контейнер с медиа-данными Instagram."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, match_args=False)
 class InstagramImage(AbstractServiceImage):
     """Объект изображения Instagram."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, match_args=False)
 class InstagramVideo(AbstractServiceVideo):
     """Объект видео Instagram."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, match_args=False)
 class InstagramAudio(AbstractServiceAudio):
     """Объект аудио Instagram (например, для сторис или рилсов)."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, eq=False, match_args=False)
 class InstagramResult(AbstractServiceResult):
     """Результат выполнения операций Instagram."""
     code: InstagramErrorCode = field(default=InstagramErrorCode.SUCCESS)
@@ -142,6 +247,17 @@ class ExtractInfoNotCalledError(Exception):
         self.message = message
 
     
+# ======= Protocols =======
+class InstagramSessionStore(Protocol):
+    """Общее хранилище cookies сессии (например, Redis) для нескольких воркеров."""
+    
+    def get_session(self, username: str) -> Optional[Dict[str, str]]: ...
+    
+    def store_session(self, username: str, session_data: Dict[str, str]) -> bool: ...
+    
+    def delete_session(self, username: str) -> bool: ...
+
+
 # ======= MainClass =======
 class InstagramDownloader(AbstractServiceDownloader):
     """
@@ -162,6 +278,7 @@ class InstagramDownloader(AbstractServiceDownloader):
         timeout: int = 300,
         max_retries: int = 3,
         cookie_path: str = "cookies",
+        session_storage: Optional[InstagramSessionStore] = None,
     ) -> None:
         """
         Инициализация загрузчика Instagram.
@@ -172,6 +289,7 @@ class InstagramDownloader(AbstractServiceDownloader):
             timeout: Время ожидания запроса в секундах
             max_retries: Максимальное количество повторных попыток подключения
             cookie_path: Путь для хранения cookies и сессии
+            session_storage: Общее хранилище сессии; проверяется раньше файла
         """
         logger.info("Инициализация загрузчика Instagram")
         
@@ -179,6 +297,7 @@ class InstagramDownloader(AbstractServiceDownloader):
         self.username = username
         self.password = password
         self.max_retries = max_retries
+        self.session_storage = session_storage
         
         # Инициализация Instaloader
         self.loader = Instaloader(
@@ -187,30 +306,66 @@ class InstagramDownloader(AbstractServiceDownloader):
             quiet=True,
         )
         
-        self.cookie_path: Optional[Path] = Path(cookie_path)
-        self.session_file: Optional[Path] = self.cookie_path.joinpath("instagram-session")
+        # Путь к файлу сессии хранится строкой: Instaloader всё равно ждёт str
+        self.cookie_path: str = cookie_path
+        self.session_file: str = os.path.join(cookie_path, "instagram-session")
+        self._session_exists: bool = os.path.isfile(self.session_file)
         
         self._data: Optional[InstagramData] = None
         self._last_result: Optional[InstagramResult] = None
         
+        # shortcode -> (момент устаревания, данные, результат)
+        self._post_cache: Dict[str, Tuple[float, InstagramData, InstagramResult]] = {}
+        self._cache_lock = Lock()
+        
         self._init_loader()
+        self._configure_http_pool()
+        
+    def _configure_http_pool(self) -> None:
+        """
+        Подключение пула соединений к HTTP-сессии Instaloader.
+        
+        login() и load_session_from_file() создают новую requests.Session,
+        поэтому адаптер монтируется после _init_loader(). Ответы 429 не
+        повторяются здесь: их обрабатывает собственный RateController Instaloader.
+        """
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=self.max_retries,
+                backoff_factor=0.3,
+                status_forcelist=(500, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        self.loader.context._session.mount("https://", adapter)
         
     def _init_loader(self) -> None:
         """Инициализация и аутентификация в Instagram."""
         try:
-            if self.session_file.exists():
+            if self._load_shared_session():
+                return
+            
+            if self._session_exists:
                 logger.info(f"Загрузка сессии из файла: {self.session_file}")
                 self.loader.load_session_from_file(
                     username=self.username,
-                    filename=str(self.session_file)
+                    filename=self.session_file
                 )
                 logger.info("Сессия успешно загружена")
             else:
                 logger.info("Создание новой сессии...")
-                self.cookie_path.mkdir(parents=True, exist_ok=True)
                 self.loader.login(user=self.username, passwd=self.password)
-                self.loader.save_session_to_file(filename=str(self.session_file))
-                logger.info("Сессия успешно создана и сохранена")
+                # Запись файла сессии не задерживает запуск воркера
+                Thread(
+                    target=self._save_session_file,
+                    name="instagram-session-save",
+                    daemon=True,
+                ).start()
+                logger.info("Сессия успешно создана")
+            
+            self._store_shared_session()
                 
         except ConnectionException as e:
             error_msg = f"Ошибка соединения при входе: {e}"
@@ -227,57 +382,127 @@ class InstagramDownloader(AbstractServiceDownloader):
             logger.error(error_msg)
             raise InstagramSessionError(error_msg, InstagramErrorCode.INITIALIZATION_ERROR)
         
-    def _validate_instagram_url(self, url: str) -> bool:
+    def _save_session_file(self) -> None:
         """
-        Проверка корректности URL Instagram.
+        Атомарная запись файла сессии в фоновом потоке.
         
-        Аргументы:
-            url: URL для проверки
+        Сессия пишется во временный файл и подменяет основной через os.replace,
+        поэтому другой процесс никогда не прочитает файл, записанный наполовину.
+        """
+        try:
+            if not os.path.isdir(self.cookie_path):
+                os.makedirs(self.cookie_path, exist_ok=True)
             
+            tmp_file = f"{self.session_file}.tmp"
+            self.loader.save_session_to_file(filename=tmp_file)
+            os.replace(tmp_file, self.session_file)
+            self._session_exists = True
+            logger.info(f"Сессия сохранена в файл: {self.session_file}")
+            
+        except Exception as e:
+            logger.error(f"Не удалось сохранить сессию в файл: {e}")
+    
+    def _load_shared_session(self) -> bool:
+        """
+        Загрузка сессии из общего хранилища.
+        
         Возвращает:
-            True, если URL корректный
+            True, если сессия найдена и загружена в Instaloader
         """
+        if self.session_storage is None:
+            return False
+        
+        session_data = self.session_storage.get_session(self.username)
+        if not session_data:
+            return False
+        
+        self.loader.load_session(self.username, session_data)
+        
+        # Сессия могла истечь или быть отозвана: такая запись удаляется,
+        # чтобы она не переиспользовалась до окончания TTL. Сбой сети при
+        # проверке ничего не говорит о сессии, поэтому запись остаётся
         try:
-            parsed_url = urlparse(url=url)
-            return parsed_url.netloc.endswith("instagram.com")
-        except Exception as e:
-            logger.debug(f"Ошибка при проверке URL: {e}")
+            logged_in_as = self.loader.test_login()
+        except ConnectionException as e:
+            logger.warning(f"Не удалось проверить сессию из общего хранилища: {e}")
             return False
-
-    def _get_shortcode(self, url: str) -> Optional[str]:
+        
+        if logged_in_as != self.username:
+            logger.warning("Сессия из общего хранилища недействительна, она будет удалена")
+            self.session_storage.delete_session(self.username)
+            return False
+        
+        logger.info("Сессия загружена из общего хранилища")
+        return True
+    
+    def _store_shared_session(self) -> None:
+        """Публикация текущей сессии в общее хранилище для других воркеров."""
+        if self.session_storage is not None:
+            self.session_storage.store_session(self.username, self.loader.save_session())
+    
+    def _relogin(self) -> None:
+        """
+        Повторный вход после того, как Instagram отклонил текущую сессию.
+        
+        Недействительная сессия удаляется из общего хранилища, новая
+        публикуется в него и записывается в файл сессии.
+        
+        Исключения:
+            InstagramSessionError: Если повторный вход не удался
+        """
+        logger.warning("Сессия Instagram недействительна, выполняется повторный вход")
+        
+        if self.session_storage is not None:
+            self.session_storage.delete_session(self.username)
+        
+        try:
+            self.loader.login(user=self.username, passwd=self.password)
+        except Exception as e:
+            error_msg = f"Повторный вход не удался: {e}"
+            logger.error(error_msg)
+            raise InstagramSessionError(error_msg, InstagramErrorCode.AUTHENTICATION_FAILED)
+        
+        self._configure_http_pool()
+        Thread(
+            target=self._save_session_file,
+            name="instagram-session-save",
+            daemon=True,
+        ).start()
+        self._store_shared_session()
+        logger.info("Повторный вход выполнен")
+        
+    def _get_shortcode(self, url: str) -> Tuple[bool, Optional[str]]:
         """
-        Извлечение shortcode из URL Instagram.
+        Проверка URL Instagram и извлечение shortcode за один проход.
         
         Аргументы:
             url: URL Instagram
             
         Возвращает:
-            Shortcode поста или None, если извлечение не удалось
+            Кортеж (URL принадлежит Instagram, shortcode или None)
         """
-        try:
-            parsed_url = urlparse(url=url)
-            path_parts = parsed_url.path.strip("/").split("/")
-            
-            if (len(path_parts) >= 2 and 
-                path_parts[0] in ["p", "tv", "reel", "reels"]):
-                shortcode = path_parts[1]
-                logger.debug(f"Извлечён shortcode: {shortcode}")
-                return shortcode
-            
-            if len(path_parts) == 1 and len(path_parts[0]) == 11:
-                shortcode = path_parts[0]
-                logger.debug(f"Извлечён shortcode: {shortcode}")
-                return shortcode
-                
-            logger.warning(f"Не удалось извлечь shortcode из URL: {url}")
-            return None
-        
-        except Exception as e:
-            logger.error(f"Ошибка при извлечении shortcode из URL {url}: {e}")
-            return None
+        if url.startswith(_IG_PREFIXES):
+            # Все префиксы заканчиваются на ".com/", путь начинается с этого "/"
+            match = _IG_PATH_RE.match(url, url.find(".com/") + 4)
+        else:
+            match = _IG_URL_RE.match(url)
+            if match is None:
+                return False, None
+        
+        shortcode = match.group(1)
+        if shortcode is None and match.group(2):
+            bare = _BARE_SHORTCODE_RE.match(match.group(2))
+            if bare is not None:
+                shortcode = bare.group(1)
+        
+        if shortcode:
+            logger.debug("Извлечён shortcode: %s", shortcode)
+        else:
+            logger.warning("Не удалось извлечь shortcode из URL: %s", url)
+        return True, shortcode
         
-    def _extract_media_info(self, post: Post) -> None:
-        """Извлечение информации о медиа из поста Instagram."""
+    def _extract_media_info(self, post: Post, media: InstagramData) -> InstagramResult:
+        """Извлечение информации о медиа из поста Instagram в media."""
         logger.debug("Извлечение информации о медиа из поста")
         
         data = post._node
@@ -285,141 +510,204 @@ class InstagramDownloader(AbstractServiceDownloader):
         if data is None:
             error_msg = "Данные поста не найдены"
             logger.error(error_msg)
-            self._last_result = InstagramResult(
+            return InstagramResult(
                 status="error",
-                data=self._data,
+                data=media,
                 context=error_msg,
                 code=InstagramErrorCode.EXTRACTION_ERROR,
             )
-            return
         
-        # Извлечение подписи
+        # Извлечение подписи (при её отсутствии Instagram присылает строку "None")
         caption = data.get("accessibility_caption")
-        if caption and caption != "None":
-            self._data.title = caption
+        if caption not in _NO_CAPTION:
+            media.title = caption
         
         # Извлечение имени владельца
-        owner_data = data.get("owner")
-        if owner_data and owner_data.get("username"):
-            self._data.author_name = owner_data.get("username")
+        username = (data.get("owner") or _EMPTY).get("username")
+        if username:
+            media.author_name = username
             
         content_type = data["__typename"]
-        logger.debug(f"Тип контента: {content_type}")
+        logger.debug("Тип контента: %s", content_type)
         
         # Обработка разных типов контента
-        if content_type.endswith(ContentType.VIDEO.value):
-            self._data.is_video = True
-            self._extract_video_content(data)
-        elif content_type.endswith(ContentType.IMAGE.value):
-            self._data.is_image = True
-            self._extract_image_content(data)
-        elif content_type.endswith(ContentType.SIDECAR.value):
-            self._data.is_image = True
-            self._extract_sidecar_content(data)
+        if content_type.endswith(_TYPE_VIDEO):
+            media.is_video = True
+            return self._extract_video_content(data, media)
+        elif content_type.endswith(_TYPE_IMAGE):
+            media.is_image = True
+            return self._extract_image_content(data, media)
+        elif content_type.endswith(_TYPE_SIDECAR):
+            media.is_image = True
+            return self._extract_sidecar_content(data, media, post)
         else:
             error_msg = f"Тип контента не поддерживается: {content_type}"
             logger.error(error_msg)
-            self._last_result = InstagramResult(
+            return InstagramResult(
                 status="error",
-                data=self._data,
+                data=media,
                 context=error_msg,
                 code=InstagramErrorCode.CONTENT_NOT_SUPPORTED,
             )
     
-    def _extract_video_content(self, data: dict) -> None:
+    def _extract_video_content(self, data: dict, media: InstagramData) -> InstagramResult:
         """Извлечение информации о видео."""
         logger.debug("Извлечение видео")
         
         # Извлечение видео
-        dimensions = data.get("dimensions")
-        self._data.videos.append(
+        dimensions = data.get("dimensions") or _EMPTY
+        media.videos.append(
             InstagramVideo(
-                id=uuid4(),
+                id=new_media_id(),
                 url=data["video_url"],
                 name=f"Video_{data['shortcode']}",
-                width=dimensions.get("width") if dimensions else None,
-                height=dimensions.get("height") if dimensions else None,
+                width=dimensions.get("width"),
+                height=dimensions.get("height"),
             )
         )
         
-        # Извлечение миниатюр
-        thumbnail_count = 0
-        for idx, image in enumerate(data.get("display_resources", [])):
-            self._data.thumbnails.append(
-                InstagramImage(
-                    id=uuid4(),
-                    url=image["src"],
-                    name=f"Thumbnail_{idx}",
-                    width=image.get("config_width"),
-                    height=image.get("config_height"),
-                )
-            )
-            thumbnail_count += 1
+        # Извлечение миниатюр; InstagramImage вызывается позиционно
+        # (id, url, name, width, height) без разбора именованных аргументов
+        new_image, new_id = InstagramImage, new_media_id
+        thumbnails = [
+            new_image(new_id(), image["src"], f"Thumbnail_{idx}",
+                      image.get("config_width"), image.get("config_height"))
+            for idx, image in enumerate(data.get("display_resources") or ())
+        ]
+        media.thumbnails.extend(thumbnails)
             
-        logger.debug(f"Извлечено 1 видео и {thumbnail_count} миниатюр")
-        self._last_result = InstagramResult(data=self._data)
+        logger.debug("Извлечено 1 видео и %d миниатюр", len(thumbnails))
+        return InstagramResult(data=media)
     
-    def _extract_image_content(self, data: dict) -> None:
+    def _extract_image_content(self, data: dict, media: InstagramData) -> InstagramResult:
         """Извлечение информации об изображениях."""
         logger.debug("Извлечение изображений")
         
-        image_count = 0
-        for idx, image in enumerate(data.get("display_resources", [])):
-            self._data.images.append(
-                InstagramImage(
-                    id=uuid4(),
-                    url=image["src"],
-                    name=f"Image_{idx}",
-                    width=image.get("config_width"),
-                    height=image.get("config_height"),
-                )
-            )
-            image_count += 1
+        new_image, new_id = InstagramImage, new_media_id
+        images = [
+            new_image(new_id(), image["src"], f"Image_{idx}",
+                      image.get("config_width"), image.get("config_height"))
+            for idx, image in enumerate(data.get("display_resources") or ())
+        ]
+        media.images.extend(images)
             
-        logger.debug(f"Извлечено {image_count} изображений")
-        self._last_result = InstagramResult(data=self._data)
+        logger.debug("Извлечено %d изображений", len(images))
+        return InstagramResult(data=media)
     
-    def _extract_sidecar_content(self, data: dict) -> None:
-        """Извлечение информации о карусели (альбоме)."""
+    def _extract_sidecar_content(self, data: dict, media: InstagramData, post: Post) -> InstagramResult:
+        """
+        Извлечение информации о карусели (альбоме).
+        
+        Дочерние узлы читаются из уже полученного ответа. Post.get_sidecar_nodes()
+        вызывается только если у видео в ответе нет video_url.
+        """
         logger.debug("Извлечение карусели")
         
-        image_count = 0
-        video_count = 0
+        images, videos = media.images, media.videos
+        images_before, videos_before = len(images), len(videos)
+        new_image, new_id = InstagramImage, new_media_id
+        sidecar_nodes = None
         
-        children_sidecar = data.get("edge_sidecar_to_children")
-        for idx, media_item in enumerate(children_sidecar.get("edges", []) if children_sidecar else []):
-            media_item_node = media_item.get("node")
-            if media_item_node:
-                media_content_type = media_item_node["__typename"]
+        edges = (data.get("edge_sidecar_to_children") or _EMPTY).get("edges") or ()
+        for idx, media_item in enumerate(edges):
+            node = media_item.get("node")
+            if not node:
+                continue
+            
+            content_type = node["__typename"]
+            if content_type.endswith(_TYPE_IMAGE):
+                images.extend(
+                    new_image(new_id(), image["src"], f"Image_{jdx}_{idx}",
+                              image.get("config_width"), image.get("config_height"))
+                    for jdx, image in enumerate(node.get("display_resources") or ())
+                )
+            elif content_type.endswith(_TYPE_VIDEO):
+                dimensions = node.get("dimensions") or _EMPTY
+                video_url = node.get("video_url")
+                if video_url is None:
+                    if sidecar_nodes is None:
+                        sidecar_nodes = list(post.get_sidecar_nodes())
+                    video_url = sidecar_nodes[idx].video_url
                 
-                if media_content_type.endswith(ContentType.IMAGE.value):
-                    for jdx, image in enumerate(media_item_node.get("display_resources", [])):
-                        self._data.images.append(
-                            InstagramImage(
-                                id=uuid4(),
-                                url=image["src"],
-                                name=f"Image_{jdx}_{idx}",
-                                width=image.get("config_width"),
-                                height=image.get("config_height"),
-                            )
-                        )
-                        image_count += 1
-    
-                elif media_content_type.endswith(ContentType.VIDEO.value):
-                    dimensions = media_item_node.get("dimensions")
-                    self._data.videos.append(
-                        InstagramVideo(
-                            id=uuid4(),
-                            url=media_item_node["video_url"],
-                            name=f"Video_{media_item_node["shortcode"]}",
-                            width=dimensions.get("width") if dimensions else None,
-                            height=dimensions.get("height") if dimensions else None,
-                        )
+                videos.append(
+                    InstagramVideo(
+                        id=new_id(),
+                        url=video_url,
+                        name=f"Video_{node['shortcode']}",
+                        width=dimensions.get("width"),
+                        height=dimensions.get("height"),
                     )
-                    video_count += 1
+                )
                     
-        logger.debug(f"Извлечено {image_count} изображений и {video_count} видео из карусели")
-        self._last_result = InstagramResult(data=self._data)
+        logger.debug(
+            "Извлечено %d изображений и %d видео из карусели",
+            len(images) - images_before,
+            len(videos) - videos_before,
+        )
+        return InstagramResult(data=media)
+    
+    def _fetch_and_extract(self, shortcode: str, url: str) -> Tuple[InstagramData, InstagramResult]:
+        """
+        Загрузка поста и извлечение медиа с кэшированием по shortcode.
+        
+        Успешные результаты хранятся POST_CACHE_TTL секунд, поэтому повторная
+        отправка той же ссылки не делает новый GraphQL-запрос. В кэш и из кэша
+        отдаются глубокие копии, чтобы изменения данных вызывающим кодом не портили запись.
+        
+        Аргументы:
+            shortcode: Shortcode поста
+            url: Исходный URL
+            
+        Возвращает:
+            Кортеж (данные, результат извлечения)
+        """
+        now = monotonic()
+        with self._cache_lock:
+            cached = self._post_cache.get(shortcode)
+            if cached is not None and cached[0] <= now:
+                del self._post_cache[shortcode]
+                cached = None
+        
+        if cached is not None:
+            logger.debug("Данные для shortcode %s взяты из кэша", shortcode)
+            media, result = deepcopy(cached[1:])
+            media.url = url
+            return media, result
+        
+        post = Post.from_shortcode(self.loader.context, shortcode)
+        media = InstagramData(url=url)
+        result = self._extract_media_info(post, media)
+        
+        if result.status != "error":
+            entry = (now + POST_CACHE_TTL, *deepcopy((media, result)))
+            with self._cache_lock:
+                if len(self._post_cache) >= POST_CACHE_SIZE:
+                    # Словарь хранит порядок вставки: удаляем самую старую запись
+                    del self._post_cache[next(iter(self._post_cache))]
+                self._post_cache[shortcode] = entry
+        
+        return media, result
+    
+    def _error_result(self, url: str, code: InstagramErrorCode, error_msg: str) -> InstagramResult:
+        """
+        Логирование ошибки и построение результата extract_info без данных.
+        
+        Аргументы:
+            url: Исходный URL
+            code: Код ошибки
+            error_msg: Текст ошибки для лога и поля context
+            
+        Возвращает:
+            InstagramResult со статусом error
+        """
+        logger.error(error_msg)
+        self._last_result = InstagramResult(
+            status="error",
+            context=error_msg,
+            code=code,
+            data=InstagramData(url=url),
+        )
+        return self._last_result
     
     def extract_info(self, url: str) -> InstagramResult:
         """
@@ -435,109 +723,43 @@ class InstagramDownloader(AbstractServiceDownloader):
         
         # Проверка URL
         if not url or not isinstance(url, str):
-            error_msg = "Некорректный URL"
-            logger.error(error_msg)
-            self._last_result = InstagramResult(
-                status="error",
-                context=error_msg,
-                code=InstagramErrorCode.EMPTY_URL,
-                data=InstagramData(url=url),
-            )
-            return self._last_result
+            return self._error_result(url, InstagramErrorCode.EMPTY_URL, "Некорректный URL")
         
-        if not self._validate_instagram_url(url):
-            error_msg = "Некорректный или неподдерживаемый URL Instagram"
-            logger.error(error_msg)
-            self._last_result = InstagramResult(
-                status="error",
-                context=error_msg,
-                code=InstagramErrorCode.INVALID_URL,
-                data=InstagramData(url=url),
-            )
-            return self._last_result
+        is_instagram, shortcode = self._get_shortcode(url)
+        if not is_instagram:
+            return self._error_result(url, InstagramErrorCode.INVALID_URL, "Некорректный или неподдерживаемый URL Instagram")
         
-        # Извлечение shortcode
-        shortcode = self._get_shortcode(url)
         if not shortcode:
-            error_msg = "Не удалось извлечь shortcode из URL"
-            logger.error(error_msg)
-            self._last_result = InstagramResult(
-                status="error",
-                context=error_msg,
-                data=InstagramData(url=url),
-                code=InstagramErrorCode.INVALID_SHORTCODE,
-            )
-            return self._last_result
+            return self._error_result(url, InstagramErrorCode.INVALID_SHORTCODE, "Не удалось извлечь shortcode из URL")
         
         try:
             logger.info(f"Извлечение информации для shortcode: {shortcode}")
             
-            post = Post.from_shortcode(self.loader.context, shortcode)
-            self._data = InstagramData(url=url)
-            self._extract_media_info(post)
+            try:
+                media, result = self._fetch_and_extract(shortcode, url)
+            except LoginRequiredException:
+                self._relogin()
+                media, result = self._fetch_and_extract(shortcode, url)
+            self._data, self._last_result = media, result
             
-            if self._last_result and self._last_result.status != "error":
-                logger.info(f"Информация успешно извлечена: {len(self._data.images)} изображений, "
-                           f"{len(self._data.videos)} видео")
+            if result.status != "error":
+                logger.info(f"Информация успешно извлечена: {len(media.images)} изображений, "
+                           f"{len(media.videos)} видео")
             else:
                 logger.warning("Извлечение информации завершилось с ошибками")
             
-            return self._last_result
-            
-        except PostChangedException as e:
-            error_msg = f"Пост изменён или недоступен: {e}"
-            logger.error(error_msg)
-            self._last_result = InstagramResult(
-                status="error",
-                context=error_msg,
-                code=InstagramErrorCode.POST_CHANGED,
-                data=InstagramData(url=url),
-            )
-            return self._last_result
+            return result
         
-        except ProfileNotExistsException as e:
-            error_msg = f"Профиль не найден: {e}"
-            logger.error(error_msg)
-            self._last_result = InstagramResult(
-                status="error",
-                context=error_msg,
-                data=InstagramData(url=url),
-                code=InstagramErrorCode.PROFILE_NOT_EXISTS,
-            )
-            return self._last_result
-        
-        except ConnectionException as e:
-            error_msg = f"Ошибка соединения: {e}"
-            logger.error(error_msg)
-            self._last_result = InstagramResult(
-                status="error",
-                context=error_msg,
-                data=InstagramData(url=url),
-                code=InstagramErrorCode.CONNECTION_ERROR,
-            )
-            return self._last_result
-        
-        except BadResponseException as e:
-            error_msg = f"Некорректный ответ API: {e}"
-            logger.error(error_msg)
-            self._last_result = InstagramResult(
-                status="error",
-                context=error_msg,
-                code=InstagramErrorCode.BAD_RESPONSE,
-                data=InstagramData(url=url),
-            )
-            return self._last_result
+        except InstagramSessionError as e:
+            return self._error_result(url, e.code, e.message)
             
         except Exception as e:
-            error_msg = f"Неожиданная ошибка при извлечении: {e}"
-            logger.error(error_msg)
-            self._last_result = InstagramResult(
-                status="error",
-                context=error_msg,
-                data=InstagramData(url=url),
-                code=InstagramErrorCode.UNEXPECTED_ERROR,
-            )
-            return self._last_result
+            code, reason = _classify_exception(e)
+            if code is InstagramErrorCode.POST_CHANGED:
+                with self._cache_lock:
+                    self._post_cache.pop(shortcode, None)
+            
+            return self._error_result(url, code, f"{reason}: {e}")
 
     def get_error_description(self, code: InstagramErrorCode) -> str:
         """
@@ -549,24 +771,4 @@ class InstagramDownloader(AbstractServiceDownloader):
         Возвращает:
             Строку с описанием ошибки
         """
-        descriptions = {
-            InstagramErrorCode.SUCCESS.value: "Операция выполнена успешно",
-            InstagramErrorCode.INVALID_URL.value: "Неправильный или неподдерживаемый URL",
-            InstagramErrorCode.INVALID_SHORTCODE.value: "Не удалось извлечь shortcode из URL",
-            InstagramErrorCode.EMPTY_URL.value: "Пустой или некорректный URL",
-            InstagramErrorCode.AUTHENTICATION_FAILED.value: "Ошибка аутентификации в Instagram",
-            InstagramErrorCode.SESSION_LOAD_FAILED.value: "Не удалось загрузить сессию из файла",
-            InstagramErrorCode.SESSION_SAVE_FAILED.value: "Не удалось сохранить сессию в файл",
-            InstagramErrorCode.CONNECTION_ERROR.value: "Ошибка сетевого соединения",
-            InstagramErrorCode.TIMEOUT_ERROR.value: "Превышено время ожидания запроса",
-            InstagramErrorCode.BAD_RESPONSE.value: "Некорректный ответ API Instagram",
-            InstagramErrorCode.POST_NOT_FOUND.value: "Пост не найден",
-            InstagramErrorCode.POST_CHANGED.value: "Пост изменён или недоступен",
-            InstagramErrorCode.PROFILE_NOT_EXISTS.value: "Профиль не существует",
-            InstagramErrorCode.CONTENT_NOT_SUPPORTED.value: "Тип контента не поддерживается",
-            InstagramErrorCode.EXTRACTION_ERROR.value: "Ошибка при извлечении контента",
-            InstagramErrorCode.UNEXPECTED_ERROR.value: "Произошла непредвиденная ошибка",
-            InstagramErrorCode.INITIALIZATION_ERROR.value: "Ошибка инициализации загрузчика",
-            InstagramErrorCode.DOWNLOAD_ERROR.value: "Ошибка при скачивании контента",
-        }
-        return descriptions.get(code, "Неизвестная ошибка")
+        return _ERROR_DESCRIPTIONS.get(code, "Неизвестная ошибка")
@@ -8,8 +8,7 @@
 import os
 import hashlib
 import logging
-from enum import Enum
-from uuid import uuid4
+from enum import Enum, StrEnum
 from pathlib import Path
 from urllib.parse import urlparse
 from dataclasses import dataclass, field
@@ -27,6 +26,7 @@ from .abstractions import (
     AbstractServiceImage,
     AbstractServiceResult,
     AbstractServiceDownloader, 
+    new_media_id,
 )
 
 
@@ -44,7 +44,7 @@ class ContentType(Enum):
     UNSUPPORTED = "unsupported"
         
 
-class RedditErrorCode(Enum):
+class RedditErrorCode(StrEnum):
     """Коды ошибок для операций с Reddit."""
     
     # Успех
@@ -85,32 +85,60 @@ class RedditErrorCode(Enum):
     EXTRACT_INFO_NOT_CALLED = "EXTRACT_INFO_NOT_CALLED"
 
 
+# Описания кодов ошибок: словарь строится один раз при импорте
+_ERROR_DESCRIPTIONS: Dict[str, str] = {
+    RedditErrorCode.SUCCESS.value: "Операция успешно завершена",
+    RedditErrorCode.INVALID_URL.value: "Предоставленный URL Reddit невалиден или не поддерживается",
+    RedditErrorCode.EMPTY_URL.value: "Предоставлен пустой или невалидный URL",
+    RedditErrorCode.UNSUPPORTED_CONTENT.value: "Тип контента Reddit не поддерживается",
+    RedditErrorCode.AUTHENTICATION_FAILED.value: "Ошибка аутентификации Reddit API",
+    RedditErrorCode.API_ERROR.value: "Reddit API вернул ошибку",
+    RedditErrorCode.RATELIMIT_EXCEEDED.value: "Превышен лимит запросов Reddit API",
+    RedditErrorCode.CONNECTION_ERROR.value: "Произошла ошибка сетевого соединения",
+    RedditErrorCode.DOWNLOAD_ERROR.value: "Ошибка загрузки медиа",
+    RedditErrorCode.EXTRACTOR_ERROR.value: "Ошибка извлечения медиа",
+    RedditErrorCode.PROXY_ERROR.value: "Ошибка подключения к прокси",
+    RedditErrorCode.GALLERY_DATA_MISSING.value: "Данные галереи не найдены в посте",
+    RedditErrorCode.GALLERY_EMPTY.value: "Галерея не содержит элементов",
+    RedditErrorCode.VIDEO_EXTRACTION_FAILED.value: "Ошибка извлечения видео контента",
+    RedditErrorCode.IMAGE_EXTRACTION_FAILED.value: "Ошибка извлечения изображения",
+    RedditErrorCode.MEDIA_METADATA_MISSING.value: "Метаданные медиа недоступны",
+    RedditErrorCode.PREVIEW_DATA_MISSING.value: "Данные предпросмотра недоступны",
+    RedditErrorCode.COOKIE_FILE_NOT_FOUND.value: "Файл cookie не найден",
+    RedditErrorCode.OUTPUT_PATH_ERROR.value: "Ошибка пути вывода",
+    RedditErrorCode.FILE_WRITE_ERROR.value: "Ошибка записи файла",
+    RedditErrorCode.UNEXPECTED_ERROR.value: "Произошла непредвиденная ошибка",
+    RedditErrorCode.INITIALIZATION_ERROR.value: "Ошибка инициализации загрузчика",
+    RedditErrorCode.EXTRACT_INFO_NOT_CALLED.value: "extract_info() должен быть вызван перед загрузкой",
+}
+
+
 # ======= DataClasses =======
-@dataclass
+@dataclass(slots=True, eq=False, match_args=False)
 class RedditData(AbstractServiceData):
     """Контейнер данных о медиа с Reddit."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, match_args=False)
 class RedditImage(AbstractServiceImage):
     """Представление изображения с Reddit."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, match_args=False)
 class RedditVideo(AbstractServiceVideo):
     """Представление видео с Reddit."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, match_args=False)
 class RedditAudio(AbstractServiceAudio):
     """Представление аудио с Reddit."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, eq=False, match_args=False)
 class RedditResult(AbstractServiceResult):
     """Результат операций с Reddit."""
     code: RedditErrorCode = field(default=RedditErrorCode.SUCCESS)
@@ -320,7 +348,7 @@ class RedditDownloader(AbstractServiceDownloader):
                             name = f"{metadata.get('e', 'Image')}_{image.get('x', 0)}x{image.get('y', 0)}_{idx}"
                             self._data.images.append(
                                 RedditImage(
-                                    id=uuid4(),
+                                    id=new_media_id(),
                                     url=image["u"],
                                     name=name,
                                     width=image.get("x"),
@@ -397,7 +425,7 @@ class RedditDownloader(AbstractServiceDownloader):
         for idx, resolution in enumerate(image_data.get("resolutions", [])):
             self._data.images.append(
                 RedditImage(
-                    id=uuid4(),
+                    id=new_media_id(),
                     url=resolution["url"],
                     name=f"{base_name}_res_{idx}",
                     width=resolution["width"],
@@ -410,7 +438,7 @@ class RedditDownloader(AbstractServiceDownloader):
             source = image_data["source"]
             self._data.images.append(
                 RedditImage(
-                    id=uuid4(),
+                    id=new_media_id(),
                     url=source["url"],
                     name=f"{base_name}_source",
                     width=source["width"],
@@ -431,7 +459,7 @@ class RedditDownloader(AbstractServiceDownloader):
             # Резервный вариант: использование прямого URL если предпросмотр недоступен
             self._data.images.append(
                 RedditImage(
-                    id=uuid4(),
+                    id=new_media_id(),
                     url=submission.url,
                     name="direct_image",
                     width=None,
@@ -519,7 +547,7 @@ class RedditDownloader(AbstractServiceDownloader):
             ):
                 self._data.videos.append(
                     RedditVideo(
-                        id=uuid4(),
+                        id=new_media_id(),
                         url=format["url"],
                         name=format["format_id"],
                         has_audio=False if format["acodec"] == "none" else True,
@@ -539,7 +567,7 @@ class RedditDownloader(AbstractServiceDownloader):
             ):
                 self._data.videos.append(
                     RedditVideo(
-                        id=uuid4(),
+                        id=new_media_id(),
                         url=format["url"],
                         name=format["format_id"],
                         has_audio=False if format["acodec"] == "none" else True,
@@ -560,7 +588,7 @@ class RedditDownloader(AbstractServiceDownloader):
             ):
                 self._data.audios.append(
                     RedditAudio(
-                        id=uuid4(),
+                        id=new_media_id(),
                         url=format["url"],
                         name=format["format_id"],
                         language=format.get("language"),
@@ -576,7 +604,7 @@ class RedditDownloader(AbstractServiceDownloader):
             ):
                 self._data.audios.append(
                     RedditAudio(
-                        id=uuid4(),
+                        id=new_media_id(),
                         url=format["url"],
                         name=format["format_id"],
                         language=format.get("language"),
@@ -593,7 +621,7 @@ class RedditDownloader(AbstractServiceDownloader):
         for idx, thumbnail in enumerate(data.get("thumbnails", [])):
             self._data.thumbnails.append(
                 RedditImage(
-                    id=uuid4(),
+                    id=new_media_id(),
                     url=thumbnail["url"],
                     name=f"Thumbnail_{idx}",
                     width=thumbnail.get("width"),
@@ -913,29 +941,4 @@ class RedditDownloader(AbstractServiceDownloader):
         Returns:
             Строка с описанием
         """
-        descriptions = {
-            RedditErrorCode.SUCCESS.value: "Операция успешно завершена",
-            RedditErrorCode.INVALID_URL.value: "Предоставленный URL Reddit невалиден или не поддерживается",
-            RedditErrorCode.EMPTY_URL.value: "Предоставлен пустой или невалидный URL",
-            RedditErrorCode.UNSUPPORTED_CONTENT.value: "Тип контента Reddit не поддерживается",
-            RedditErrorCode.AUTHENTICATION_FAILED.value: "Ошибка аутентификации Reddit API",
-            RedditErrorCode.API_ERROR.value: "Reddit API вернул ошибку",
-            RedditErrorCode.RATELIMIT_EXCEEDED.value: "Превышен лимит запросов Reddit API",
-            RedditErrorCode.CONNECTION_ERROR.value: "Произошла ошибка сетевого соединения",
-            RedditErrorCode.DOWNLOAD_ERROR.value: "Ошибка загрузки медиа",
-            RedditErrorCode.EXTRACTOR_ERROR.value: "Ошибка извлечения медиа",
-            RedditErrorCode.PROXY_ERROR.value: "Ошибка подключения к прокси",
-            RedditErrorCode.GALLERY_DATA_MISSING.value: "Данные галереи не найдены в посте",
-            RedditErrorCode.GALLERY_EMPTY.value: "Галерея не содержит элементов",
-            RedditErrorCode.VIDEO_EXTRACTION_FAILED.value: "Ошибка извлечения видео контента",
-            RedditErrorCode.IMAGE_EXTRACTION_FAILED.value: "Ошибка извлечения изображения",
-            RedditErrorCode.MEDIA_METADATA_MISSING.value: "Метаданные медиа недоступны",
-            RedditErrorCode.PREVIEW_DATA_MISSING.value: "Данные предпросмотра недоступны",
-            RedditErrorCode.COOKIE_FILE_NOT_FOUND.value: "Файл cookie не найден",
-            RedditErrorCode.OUTPUT_PATH_ERROR.value: "Ошибка пути вывода",
-            RedditErrorCode.FILE_WRITE_ERROR.value: "Ошибка записи файла",
-            RedditErrorCode.UNEXPECTED_ERROR.value: "Произошла непредвиденная ошибка",
-            RedditErrorCode.INITIALIZATION_ERROR.value: "Ошибка инициализации загрузчика",
-            RedditErrorCode.EXTRACT_INFO_NOT_CALLED.value: "extract_info() должен быть вызван перед загрузкой",
-        }
-        return descriptions.get(code, "Неизвестная ошибка")
+        return _ERROR_DESCRIPTIONS.get(code, "Неизвестная ошибка")
@@ -7,10 +7,9 @@
 
 import hashlib
 import logging
-from enum import Enum
-from uuid import uuid4
+from enum import Enum, StrEnum
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import ParseResult, urlparse
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Union
 
@@ -24,6 +23,7 @@ from .abstractions import (
     AbstractServiceImage,
     AbstractServiceResult,
     AbstractServiceDownloader, 
+    new_media_id,
 )
 
 
@@ -41,7 +41,7 @@ class ContentType(Enum):
     PLAYLIST = "playlist"
     
 
-class RutubeErrorCode(Enum):
+class RutubeErrorCode(StrEnum):
     """Перечисление, представляющее коды ошибок для операций с Rutube."""
     
     # Успех
@@ -78,32 +78,58 @@ class RutubeErrorCode(Enum):
     YT_DLP_ERROR = "YT_DLP_ERROR"
     
 
+# Описания кодов ошибок: словарь строится один раз при импорте
+_ERROR_DESCRIPTIONS: Dict[str, str] = {
+    RutubeErrorCode.SUCCESS.value: "Операция успешно завершена",
+    RutubeErrorCode.INVALID_URL.value: "Предоставленный URL Rutube невалиден или не поддерживается",
+    RutubeErrorCode.EMPTY_URL.value: "Предоставлен пустой или невалидный URL",
+    RutubeErrorCode.UNSUPPORTED_CONTENT_TYPE.value: "Тип контента Rutube не поддерживается",
+    RutubeErrorCode.UNSUPPORTED_MEDIA_TYPE.value: "Тип медиа не поддерживается",
+    RutubeErrorCode.CONNECTION_ERROR.value: "Произошла ошибка сетевого соединения",
+    RutubeErrorCode.DOWNLOAD_ERROR.value: "Ошибка загрузки медиа",
+    RutubeErrorCode.EXTRACTOR_ERROR.value: "Ошибка извлечения медиа",
+    RutubeErrorCode.PROXY_ERROR.value: "Ошибка подключения к прокси",
+    RutubeErrorCode.LIVE_STREAM_NOT_SUPPORTED.value: "Прямые трансляции не поддерживаются",
+    RutubeErrorCode.PLAYLIST_NOT_SUPPORTED.value: "Плейлисты не поддерживаются",
+    RutubeErrorCode.ACCOUNT_NOT_SUPPORTED.value: "Контент аккаунта/канала не поддерживается",
+    RutubeErrorCode.NO_MEDIA_FORMATS_FOUND.value: "Не найдено поддерживаемых медиа форматов",
+    RutubeErrorCode.NO_THUMBNAILS_FOUND.value: "Миниатюры не найдены",
+    RutubeErrorCode.COOKIE_FILE_NOT_FOUND.value: "Файл cookie не найден",
+    RutubeErrorCode.OUTPUT_PATH_ERROR.value: "Ошибка пути вывода",
+    RutubeErrorCode.FILE_WRITE_ERROR.value: "Ошибка записи файла",
+    RutubeErrorCode.UNEXPECTED_ERROR.value: "Произошла непредвиденная ошибка",
+    RutubeErrorCode.INITIALIZATION_ERROR.value: "Ошибка инициализации загрузчика",
+    RutubeErrorCode.EXTRACT_INFO_NOT_CALLED.value: "extract_info() должен быть вызван перед загрузкой",
+    RutubeErrorCode.YT_DLP_ERROR.value: "Произошла внутренняя ошибка yt-dlp",
+}
+
+
 # ======= DataClasses =======
-@dataclass
+@dataclass(slots=True, eq=False, match_args=False)
 class RutubeData(AbstractServiceData):
     """Контейнер для данных медиа с Rutube."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, match_args=False)
 class RutubeImage(AbstractServiceImage):
     """Представляет миниатюру изображения Rutube."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, match_args=False)
 class RutubeVideo(AbstractServiceVideo):
     """Представляет видео формат Rutube."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, match_args=False)
 class RutubeAudio(AbstractServiceAudio):
     """Представляет аудио формат Rutube."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, eq=False, match_args=False)
 class RutubeResult(AbstractServiceResult):
     """Результат операций с Rutube."""
     code: RutubeErrorCode = field(default=RutubeErrorCode.SUCCESS)
@@ -201,20 +227,20 @@ class RutubeDownloader(AbstractServiceDownloader):
             logger.error(error_msg)
             raise Exception(error_msg) from e
         
-    def _classify_url(self, url: str) -> Optional[ContentType]:
+    def _classify_url(self, parsed: ParseResult) -> Optional[ContentType]:
         """
         Классификация типа контента URL Rutube.
         
         Args:
-            url: URL Rutube для классификации
+            parsed: Разобранный URL Rutube
             
         Returns:
             ContentType или None если классификация не удалась
         """
-        logger.debug(f"Классификация URL: {url}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Классификация URL: {parsed.geturl()}")
         
         try:
-            parsed = urlparse(url=url)
             path = parsed.path.lower()
             path_parts = path.strip("/").split("/")
             
@@ -240,22 +266,17 @@ class RutubeDownloader(AbstractServiceDownloader):
             logger.error(f"Ошибка классификации URL: {e}")
             return None
         
-    def _validate_rutube_url(self, url: str) -> bool:
+    def _validate_rutube_url(self, parsed: ParseResult) -> bool:
         """
         Проверка валидности URL Rutube.
         
         Args:
-            url: URL для проверки
+            parsed: Разобранный URL для проверки
             
         Returns:
             True если URL является валидным URL Rutube
         """
-        try:
-            parsed = urlparse(url)
-            return parsed.netloc.endswith("rutube.ru")
-        except Exception as e:
-            logger.debug(f"Ошибка проверки URL: {e}")
-            return False
+        return parsed.netloc.endswith("rutube.ru")
         
     def extract_info(self, url: str) -> RutubeResult:
         """
@@ -281,7 +302,13 @@ class RutubeDownloader(AbstractServiceDownloader):
             )
             return self._last_result
         
-        if not self._validate_rutube_url(url):
+        # URL разбирается один раз: результат нужен и для проверки, и для классификации
+        try:
+            parsed = urlparse(url)
+        except ValueError:
+            parsed = None
+            
+        if parsed is None or not self._validate_rutube_url(parsed):
             error_msg = "Невалидный или неподдерживаемый URL Rutube"
             logger.error(error_msg)
             self._last_result = RutubeResult(
@@ -298,7 +325,7 @@ class RutubeDownloader(AbstractServiceDownloader):
         self._data = RutubeData(url=url) 
         
         # Классификация типа контента
-        content_type = self._classify_url(url=url)
+        content_type = self._classify_url(parsed)
         if not content_type:
             error_msg = "Не удалось классифицировать тип контента URL"
             logger.error(error_msg)
@@ -411,7 +438,7 @@ class RutubeDownloader(AbstractServiceDownloader):
             ):
                 self._data.videos.append(
                     RutubeVideo(
-                        id=uuid4(),
+                        id=new_media_id(),
                         url=format["url"],
                         name=format["format_id"],
                         has_audio=False if format["acodec"] == "none" else True,
@@ -431,7 +458,7 @@ class RutubeDownloader(AbstractServiceDownloader):
             ):
                 self._data.videos.append(
                     RutubeVideo(
-                        id=uuid4(),
+                        id=new_media_id(),
                         url=format["url"],
                         name=format["format_id"],
                         has_audio=False if format["acodec"] == "none" else True,
@@ -452,7 +479,7 @@ class RutubeDownloader(AbstractServiceDownloader):
             ):
                 self._data.audios.append(
                     RutubeAudio(
-                        id=uuid4(),
+                        id=new_media_id(),
                         url=format["url"],
                         name=format["format_id"],
                         language=format.get("language"),
@@ -468,7 +495,7 @@ class RutubeDownloader(AbstractServiceDownloader):
             ):
                 self._data.audios.append(
                     RutubeAudio(
-                        id=uuid4(),
+                        id=new_media_id(),
                         url=format["url"],
                         name=format["format_id"],
                         language=format.get("language"),
@@ -499,7 +526,7 @@ class RutubeDownloader(AbstractServiceDownloader):
         for idx, thumbnail in enumerate(data.get("thumbnails", [])):  
             self._data.thumbnails.append(
                 RutubeImage(
-                    id=uuid4(),
+                    id=new_media_id(),
                     url=thumbnail["url"],
                     name=f"Image_{idx}",
                     width=thumbnail.get("width"),
@@ -750,29 +777,6 @@ class RutubeDownloader(AbstractServiceDownloader):
         Returns:
             Строка с описанием
         """
-        descriptions = {
-            RutubeErrorCode.SUCCESS.value: "Операция успешно завершена",
-            RutubeErrorCode.INVALID_URL.value: "Предоставленный URL Rutube невалиден или не поддерживается",
-            RutubeErrorCode.EMPTY_URL.value: "Предоставлен пустой или невалидный URL",
-            RutubeErrorCode.UNSUPPORTED_CONTENT_TYPE.value: "Тип контента Rutube не поддерживается",
-            RutubeErrorCode.UNSUPPORTED_MEDIA_TYPE.value: "Тип медиа не поддерживается",
-            RutubeErrorCode.CONNECTION_ERROR.value: "Произошла ошибка сетевого соединения",
-            RutubeErrorCode.DOWNLOAD_ERROR.value: "Ошибка загрузки медиа",
-            RutubeErrorCode.EXTRACTOR_ERROR.value: "Ошибка извлечения медиа",
-            RutubeErrorCode.PROXY_ERROR.value: "Ошибка подключения к прокси",
-            RutubeErrorCode.LIVE_STREAM_NOT_SUPPORTED.value: "Прямые трансляции не поддерживаются",
-            RutubeErrorCode.PLAYLIST_NOT_SUPPORTED.value: "Плейлисты не поддерживаются",
-            RutubeErrorCode.ACCOUNT_NOT_SUPPORTED.value: "Контент аккаунта/канала не поддерживается",
-            RutubeErrorCode.NO_MEDIA_FORMATS_FOUND.value: "Не найдено поддерживаемых медиа форматов",
-            RutubeErrorCode.NO_THUMBNAILS_FOUND.value: "Миниатюры не найдены",
-            RutubeErrorCode.COOKIE_FILE_NOT_FOUND.value: "Файл cookie не найден",
-            RutubeErrorCode.OUTPUT_PATH_ERROR.value: "Ошибка пути вывода",
-            RutubeErrorCode.FILE_WRITE_ERROR.value: "Ошибка записи файла",
-            RutubeErrorCode.UNEXPECTED_ERROR.value: "Произошла непредвиденная ошибка",
-            RutubeErrorCode.INITIALIZATION_ERROR.value: "Ошибка инициализации загрузчика",
-            RutubeErrorCode.EXTRACT_INFO_NOT_CALLED.value: "extract_info() должен быть вызван перед загрузкой",
-            RutubeErrorCode.YT_DLP_ERROR.value: "Произошла внутренняя ошибка yt-dlp",
-        }
-        return descriptions.get(code, "Неизвестная ошибка")
+        return _ERROR_DESCRIPTIONS.get(code, "Неизвестная ошибка")
 
         
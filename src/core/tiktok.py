@@ -7,8 +7,7 @@
 
 import hashlib
 import logging
-from enum import Enum
-from uuid import uuid4
+from enum import Enum, StrEnum
 from pathlib import Path
 from urllib.parse import urlparse
 from dataclasses import dataclass, field
@@ -25,6 +24,7 @@ from .abstractions import (
     AbstractServiceImage,
     AbstractServiceResult,
     AbstractServiceDownloader, 
+    new_media_id,
 )
 
 
@@ -43,7 +43,7 @@ class ContentType(Enum):
     UNKNOWN = "unknown"
     
     
-class TikTokErrorCode(Enum):
+class TikTokErrorCode(StrEnum):
     """Перечисление, представляющее коды ошибок для операций с TikTok."""
     
     # Успех
@@ -85,32 +85,63 @@ class TikTokErrorCode(Enum):
     YT_DLP_ERROR = "YT_DLP_ERROR"
 
 
+# Описания кодов ошибок: словарь строится один раз при импорте
+_ERROR_DESCRIPTIONS: Dict[str, str] = {
+    TikTokErrorCode.SUCCESS.value: "Операция успешно завершена",
+    TikTokErrorCode.INVALID_URL.value: "Предоставленный URL TikTok неверен или не поддерживается",
+    TikTokErrorCode.EMPTY_URL.value: "Предоставлен пустой или неверный URL",
+    TikTokErrorCode.UNSUPPORTED_CONTENT_TYPE.value: "Тип контента TikTok не поддерживается",
+    TikTokErrorCode.URL_RESOLUTION_FAILED.value: "Не удалось разрешить сокращенный URL TikTok",
+    TikTokErrorCode.CONNECTION_ERROR.value: "Произошла ошибка сетевого соединения",
+    TikTokErrorCode.DOWNLOAD_ERROR.value: "Не удалось загрузить медиа",
+    TikTokErrorCode.EXTRACTOR_ERROR.value: "Не удалось извлечь медиа",
+    TikTokErrorCode.PROXY_ERROR.value: "Ошибка подключения к прокси",
+    TikTokErrorCode.NO_EXTRACTOR_FOUND.value: "Не найден подходящий экстрактор для URL",
+    TikTokErrorCode.NO_CONTENT_FOUND.value: "Контент не найден для данного URL",
+    TikTokErrorCode.METADATA_EXTRACTION_FAILED.value: "Не удалось извлечь метаданные",
+    TikTokErrorCode.VIDEO_EXTRACTION_FAILED.value: "Не удалось извлечь видео контент",
+    TikTokErrorCode.PHOTO_EXTRACTION_FAILED.value: "Не удалось извлечь фото контент",
+    TikTokErrorCode.MUSIC_EXTRACTION_FAILED.value: "Не удалось извлечь музыку",
+    TikTokErrorCode.NO_MEDIA_FORMATS_FOUND.value: "Не найдено поддерживаемых медиа форматов",
+    TikTokErrorCode.NO_IMAGES_FOUND.value: "Изображения не найдены в фото посте",
+    TikTokErrorCode.NO_THUMBNAILS_FOUND.value: "Миниатюры не найдены",
+    TikTokErrorCode.COOKIE_FILE_NOT_FOUND.value: "Файл cookie не найден",
+    TikTokErrorCode.OUTPUT_PATH_ERROR.value: "Ошибка выходного пути",
+    TikTokErrorCode.FILE_WRITE_ERROR.value: "Ошибка записи файла",
+    TikTokErrorCode.UNEXPECTED_ERROR.value: "Произошла непредвиденная ошибка",
+    TikTokErrorCode.INITIALIZATION_ERROR.value: "Не удалось инициализировать загрузчик",
+    TikTokErrorCode.EXTRACT_INFO_NOT_CALLED.value: "extract_info() должен быть вызван перед загрузкой",
+    TikTokErrorCode.GALLERY_DL_ERROR.value: "Произошла внутренняя ошибка gallery-dl",
+    TikTokErrorCode.YT_DLP_ERROR.value: "Произошла внутренняя ошибка yt-dlp",
+}
+
+
 # ======= DataClasses =======
-@dataclass
+@dataclass(slots=True, eq=False, match_args=False)
 class TikTokData(AbstractServiceData):
     """Контейнер для данных медиа с TikTok."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, match_args=False)
 class TikTokImage(AbstractServiceImage):
     """Представляет изображение TikTok."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, match_args=False)
 class TikTokVideo(AbstractServiceVideo):
     """Представляет видео формат TikTok."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, match_args=False)
 class TikTokAudio(AbstractServiceAudio):
     """Представляет аудио формат TikTok."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, eq=False, match_args=False)
 class TikTokResult(AbstractServiceResult):
     """Результат операций с TikTok."""
     code: TikTokErrorCode = field(default=TikTokErrorCode.SUCCESS)
@@ -329,7 +360,7 @@ class TikTokDownloader(AbstractServiceDownloader):
             logger.debug("Извлечение информации о музыке")
             self._data.audios.append(
                 TikTokAudio(
-                    id=uuid4(),
+                    id=new_media_id(),
                     name="music",
                     url=music["playUrl"],
                     author=music.get("authorName"),
@@ -396,7 +427,7 @@ class TikTokDownloader(AbstractServiceDownloader):
             ):
                 self._data.videos.append(
                     TikTokVideo(
-                        id=uuid4(),
+                        id=new_media_id(),
                         url=format["url"],
                         name=format["format_id"],
                         has_audio=False if format["acodec"] == "none" else True,
@@ -416,7 +447,7 @@ class TikTokDownloader(AbstractServiceDownloader):
             ):
                 self._data.videos.append(
                     TikTokVideo(
-                        id=uuid4(),
+                        id=new_media_id(),
                         url=format["url"],
                         name=format["format_id"],
                         has_audio=False if format["acodec"] == "none" else True,
@@ -437,7 +468,7 @@ class TikTokDownloader(AbstractServiceDownloader):
             ):
                 self._data.audios.append(
                     TikTokAudio(
-                        id=uuid4(),
+                        id=new_media_id(),
                         url=format["url"],
                         name=format["format_id"],
                         language=format.get("language"),
@@ -453,7 +484,7 @@ class TikTokDownloader(AbstractServiceDownloader):
             ):
                 self._data.audios.append(
                     TikTokAudio(
-                        id=uuid4(),
+                        id=new_media_id(),
                         url=format["url"],
                         name=format["format_id"],
                         language=format.get("language"),
@@ -484,7 +515,7 @@ class TikTokDownloader(AbstractServiceDownloader):
         for thumbnail in data.get("thumbnails", []):
             self._data.thumbnails.append(
                 TikTokImage(
-                    id=uuid4(),
+                    id=new_media_id(),
                     url=thumbnail["url"],
                     name=thumbnail["id"],
                     width=thumbnail.get("width"),
@@ -513,7 +544,7 @@ class TikTokDownloader(AbstractServiceDownloader):
             for idx, image in enumerate(image_post.get("images", [])):
                 self._data.images.append(
                     TikTokImage(
-                        id=uuid4(),
+                        id=new_media_id(),
                         url=image["imageURL"]["urlList"][0],
                         name=f"Image_{idx}",
                         width=image.get("imageWidth"),
@@ -882,32 +913,4 @@ class TikTokDownloader(AbstractServiceDownloader):
         Returns:
             Строка описания
         """
-        descriptions = {
-            TikTokErrorCode.SUCCESS.value: "Операция успешно завершена",
-            TikTokErrorCode.INVALID_URL.value: "Предоставленный URL TikTok неверен или не поддерживается",
-            TikTokErrorCode.EMPTY_URL.value: "Предоставлен пустой или неверный URL",
-            TikTokErrorCode.UNSUPPORTED_CONTENT_TYPE.value: "Тип контента TikTok не поддерживается",
-            TikTokErrorCode.URL_RESOLUTION_FAILED.value: "Не удалось разрешить сокращенный URL TikTok",
-            TikTokErrorCode.CONNECTION_ERROR.value: "Произошла ошибка сетевого соединения",
-            TikTokErrorCode.DOWNLOAD_ERROR.value: "Не удалось загрузить медиа",
-            TikTokErrorCode.EXTRACTOR_ERROR.value: "Не удалось извлечь медиа",
-            TikTokErrorCode.PROXY_ERROR.value: "Ошибка подключения к прокси",
-            TikTokErrorCode.NO_EXTRACTOR_FOUND.value: "Не найден подходящий экстрактор для URL",
-            TikTokErrorCode.NO_CONTENT_FOUND.value: "Контент не найден для данного URL",
-            TikTokErrorCode.METADATA_EXTRACTION_FAILED.value: "Не удалось извлечь метаданные",
-            TikTokErrorCode.VIDEO_EXTRACTION_FAILED.value: "Не удалось извлечь видео контент",
-            TikTokErrorCode.PHOTO_EXTRACTION_FAILED.value: "Не удалось извлечь фото контент",
-            TikTokErrorCode.MUSIC_EXTRACTION_FAILED.value: "Не удалось извлечь музыку",
-            TikTokErrorCode.NO_MEDIA_FORMATS_FOUND.value: "Не найдено поддерживаемых медиа форматов",
-            TikTokErrorCode.NO_IMAGES_FOUND.value: "Изображения не найдены в фото посте",
-            TikTokErrorCode.NO_THUMBNAILS_FOUND.value: "Миниатюры не найдены",
-            TikTokErrorCode.COOKIE_FILE_NOT_FOUND.value: "Файл cookie не найден",
-            TikTokErrorCode.OUTPUT_PATH_ERROR.value: "Ошибка выходного пути",
-            TikTokErrorCode.FILE_WRITE_ERROR.value: "Ошибка записи файла",
-            TikTokErrorCode.UNEXPECTED_ERROR.value: "Произошла непредвиденная ошибка",
-            TikTokErrorCode.INITIALIZATION_ERROR.value: "Не удалось инициализировать загрузчик",
-            TikTokErrorCode.EXTRACT_INFO_NOT_CALLED.value: "extract_info() должен быть вызван перед загрузкой",
-            TikTokErrorCode.GALLERY_DL_ERROR.value: "Произошла внутренняя ошибка gallery-dl",
-            TikTokErrorCode.YT_DLP_ERROR.value: "Произошла внутренняя ошибка yt-dlp",
-        }
-        return descriptions.get(code, "Неизвестная ошибка")
+        return _ERROR_DESCRIPTIONS.get(code, "Неизвестная ошибка")
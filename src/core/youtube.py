@@ -8,10 +8,9 @@
 import hashlib
 import json
 import logging
-from enum import Enum
-from uuid import uuid4
+from enum import Enum, StrEnum
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import ParseResult, urlparse
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Union
 
@@ -25,6 +24,7 @@ from .abstractions import (
     AbstractServiceImage,
     AbstractServiceResult,
     AbstractServiceDownloader, 
+    new_media_id,
 )
 
 
@@ -43,7 +43,7 @@ class ContentType(Enum):
     PLAYLIST = "playlist"
     
     
-class YoutubeErrorCode(Enum):
+class YoutubeErrorCode(StrEnum):
     """Перечисление, представляющее коды ошибок для операций с YouTube."""
     
     # Успех
@@ -84,32 +84,62 @@ class YoutubeErrorCode(Enum):
     YT_DLP_ERROR = "YT_DLP_ERROR"
 
 
+# Описания кодов ошибок: словарь строится один раз при импорте
+_ERROR_DESCRIPTIONS: Dict[str, str] = {
+    YoutubeErrorCode.SUCCESS.value: "Операция успешно завершена",
+    YoutubeErrorCode.INVALID_URL.value: "Предоставленный URL YouTube неверен или не поддерживается",
+    YoutubeErrorCode.EMPTY_URL.value: "Предоставлен пустой или неверный URL",
+    YoutubeErrorCode.UNSUPPORTED_CONTENT_TYPE.value: "Тип контента YouTube не поддерживается",
+    YoutubeErrorCode.UNSUPPORTED_MEDIA_TYPE.value: "Тип медиа не поддерживается",
+    YoutubeErrorCode.CONNECTION_ERROR.value: "Произошла ошибка сетевого соединения",
+    YoutubeErrorCode.DOWNLOAD_ERROR.value: "Не удалось загрузить медиа",
+    YoutubeErrorCode.EXTRACTOR_ERROR.value: "Не удалось извлечь медиа",
+    YoutubeErrorCode.PROXY_ERROR.value: "Ошибка подключения к прокси",
+    YoutubeErrorCode.LIVE_STREAM_NOT_SUPPORTED.value: "Прямые трансляции не поддерживаются",
+    YoutubeErrorCode.PLAYLIST_NOT_SUPPORTED.value: "Плейлисты не поддерживаются",
+    YoutubeErrorCode.ACCOUNT_NOT_SUPPORTED.value: "Контент аккаунта/канала не поддерживается",
+    YoutubeErrorCode.SHORTS_NOT_SUPPORTED.value: "YouTube Shorts не поддерживаются",
+    YoutubeErrorCode.POST_NOT_SUPPORTED.value: "Сообщества не поддерживаются",
+    YoutubeErrorCode.NO_VIDEO_FORMATS_FOUND.value: "Поддерживаемые видео форматы не найдены",
+    YoutubeErrorCode.NO_AUDIO_FORMATS_FOUND.value: "Поддерживаемые аудио форматы не найдены",
+    YoutubeErrorCode.NO_THUMBNAILS_FOUND.value: "Миниатюры не найдены",
+    YoutubeErrorCode.NO_MEDIA_FORMATS_FOUND.value: "Поддерживаемые медиа форматы не найдены",
+    YoutubeErrorCode.COOKIE_FILE_NOT_FOUND.value: "Файл cookie не найден",
+    YoutubeErrorCode.OUTPUT_PATH_ERROR.value: "Ошибка выходного пути",
+    YoutubeErrorCode.FILE_WRITE_ERROR.value: "Ошибка записи файла",
+    YoutubeErrorCode.UNEXPECTED_ERROR.value: "Произошла непредвиденная ошибка",
+    YoutubeErrorCode.INITIALIZATION_ERROR.value: "Не удалось инициализировать загрузчик",
+    YoutubeErrorCode.EXTRACT_INFO_NOT_CALLED.value: "extract_info() должен быть вызван перед загрузкой",
+    YoutubeErrorCode.YT_DLP_ERROR.value: "Произошла внутренняя ошибка yt-dlp",
+}
+
+
 # ======= DataClasses =======
-@dataclass
+@dataclass(slots=True, eq=False, match_args=False)
 class YoutubeData(AbstractServiceData):
     """Контейнер для данных медиа с YouTube."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, match_args=False)
 class YoutubeImage(AbstractServiceImage):
     """Представляет миниатюру YouTube."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, match_args=False)
 class YoutubeVideo(AbstractServiceVideo):
     """Представляет видео формат YouTube."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, match_args=False)
 class YoutubeAudio(AbstractServiceAudio):
     """Представляет аудио формат YouTube."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, eq=False, match_args=False)
 class YoutubeResult(AbstractServiceResult):
     """Результат операций с YouTube."""
     code: YoutubeErrorCode = field(default=YoutubeErrorCode.SUCCESS)
@@ -210,20 +240,20 @@ class YoutubeDownloader(AbstractServiceDownloader):
             logger.error(error_msg)
             raise Exception(error_msg) from e
         
-    def _classify_url(self, url: str) -> ContentType:
+    def _classify_url(self, parsed: ParseResult) -> ContentType:
         """
         Классификация типа контента URL YouTube.
         
         Args:
-            url: URL YouTube для классификации
+            parsed: Разобранный URL YouTube
             
         Returns:
             ContentType: Классифицированный тип контента
         """
-        logger.debug(f"Классификация URL: {url}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Классификация URL: {parsed.geturl()}")
         
         try:
-            parsed = urlparse(url=url)
             path = parsed.path.lower()
             path_parts = path.strip("/").split("/")
             
@@ -247,22 +277,17 @@ class YoutubeDownloader(AbstractServiceDownloader):
             logger.error(f"Ошибка классификации URL: {e}")
             return None
         
-    def _validate_youtube_url(self, url: str) -> bool:
+    def _validate_youtube_url(self, parsed: ParseResult) -> bool:
         """
         Проверка валидности URL YouTube.
         
         Args:
-            url: URL для проверки
+            parsed: Разобранный URL для проверки
             
         Returns:
             True если URL является валидным URL YouTube
         """
-        try:
-            parsed = urlparse(url)
-            return any(domain in parsed.netloc for domain in ["youtube.com", "youtu.be", "www.youtube.com"])
-        except Exception as e:
-            logger.debug(f"Ошибка проверки URL: {e}")
-            return False
+        return any(domain in parsed.netloc for domain in ["youtube.com", "youtu.be", "www.youtube.com"])
         
     def extract_info(self, url: str) -> YoutubeResult:
         """
@@ -288,7 +313,13 @@ class YoutubeDownloader(AbstractServiceDownloader):
             )
             return self._last_result
             
-        if not self._validate_youtube_url(url):
+        # URL разбирается один раз: результат нужен и для проверки, и для классификации
+        try:
+            parsed = urlparse(url)
+        except ValueError:
+            parsed = None
+            
+        if parsed is None or not self._validate_youtube_url(parsed):
             error_msg = "Неверный или неподдерживаемый URL YouTube"
             logger.error(error_msg)
             self._last_result = YoutubeResult(
@@ -305,7 +336,7 @@ class YoutubeDownloader(AbstractServiceDownloader):
         self._data = YoutubeData(url=url) 
         
         # Классификация типа контента
-        content_type = self._classify_url(url=url)
+        content_type = self._classify_url(parsed)
         if not content_type:
             error_msg = "Не удалось классифицировать тип контента URL"
             logger.error(error_msg)
@@ -418,7 +449,7 @@ class YoutubeDownloader(AbstractServiceDownloader):
             ):
                 self._data.videos.append(
                     YoutubeVideo(
-                        id=uuid4(),
+                        id=new_media_id(),
                         url=format["url"],
                         name=format["format_id"],
                         has_audio=False if format["acodec"] == "none" else True,
@@ -438,7 +469,7 @@ class YoutubeDownloader(AbstractServiceDownloader):
             ):
                 self._data.videos.append(
                     YoutubeVideo(
-                        id=uuid4(),
+                        id=new_media_id(),
                         url=format["url"],
                         name=format["format_id"],
                         has_audio=False if format["acodec"] == "none" else True,
@@ -459,7 +490,7 @@ class YoutubeDownloader(AbstractServiceDownloader):
             ):
                 self._data.audios.append(
                     YoutubeAudio(
-                        id=uuid4(),
+                        id=new_media_id(),
                         url=format["url"],
                         name=format["format_id"],
                         language=format.get("language"),
@@ -475,7 +506,7 @@ class YoutubeDownloader(AbstractServiceDownloader):
             ):
                 self._data.audios.append(
                     YoutubeAudio(
-                        id=uuid4(),
+                        id=new_media_id(),
                         url=format["url"],
                         name=format["format_id"],
                         language=format.get("language"),
@@ -510,7 +541,7 @@ class YoutubeDownloader(AbstractServiceDownloader):
             ):
                 self._data.thumbnails.append(
                     YoutubeImage(
-                        id=uuid4(),
+                        id=new_media_id(),
                         url=thumbnail["url"],
                         name=thumbnail["id"],
                         width=thumbnail.get("width"),
@@ -761,33 +792,6 @@ class YoutubeDownloader(AbstractServiceDownloader):
         Returns:
             Строка описания
         """
-        descriptions = {
-            YoutubeErrorCode.SUCCESS.value: "Операция успешно завершена",
-            YoutubeErrorCode.INVALID_URL.value: "Предоставленный URL YouTube неверен или не поддерживается",
-            YoutubeErrorCode.EMPTY_URL.value: "Предоставлен пустой или неверный URL",
-            YoutubeErrorCode.UNSUPPORTED_CONTENT_TYPE.value: "Тип контента YouTube не поддерживается",
-            YoutubeErrorCode.UNSUPPORTED_MEDIA_TYPE.value: "Тип медиа не поддерживается",
-            YoutubeErrorCode.CONNECTION_ERROR.value: "Произошла ошибка сетевого соединения",
-            YoutubeErrorCode.DOWNLOAD_ERROR.value: "Не удалось загрузить медиа",
-            YoutubeErrorCode.EXTRACTOR_ERROR.value: "Не удалось извлечь медиа",
-            YoutubeErrorCode.PROXY_ERROR.value: "Ошибка подключения к прокси",
-            YoutubeErrorCode.LIVE_STREAM_NOT_SUPPORTED.value: "Прямые трансляции не поддерживаются",
-            YoutubeErrorCode.PLAYLIST_NOT_SUPPORTED.value: "Плейлисты не поддерживаются",
-            YoutubeErrorCode.ACCOUNT_NOT_SUPPORTED.value: "Контент аккаунта/канала не поддерживается",
-            YoutubeErrorCode.SHORTS_NOT_SUPPORTED.value: "YouTube Shorts не поддерживаются",
-            YoutubeErrorCode.POST_NOT_SUPPORTED.value: "Сообщества не поддерживаются",
-            YoutubeErrorCode.NO_VIDEO_FORMATS_FOUND.value: "Поддерживаемые видео форматы не найдены",
-            YoutubeErrorCode.NO_AUDIO_FORMATS_FOUND.value: "Поддерживаемые аудио форматы не найдены",
-            YoutubeErrorCode.NO_THUMBNAILS_FOUND.value: "Миниатюры не найдены",
-            YoutubeErrorCode.NO_MEDIA_FORMATS_FOUND.value: "Поддерживаемые медиа форматы не найдены",
-            YoutubeErrorCode.COOKIE_FILE_NOT_FOUND.value: "Файл cookie не найден",
-            YoutubeErrorCode.OUTPUT_PATH_ERROR.value: "Ошибка выходного пути",
-            YoutubeErrorCode.FILE_WRITE_ERROR.value: "Ошибка записи файла",
-            YoutubeErrorCode.UNEXPECTED_ERROR.value: "Произошла непредвиденная ошибка",
-            YoutubeErrorCode.INITIALIZATION_ERROR.value: "Не удалось инициализировать загрузчик",
-            YoutubeErrorCode.EXTRACT_INFO_NOT_CALLED.value: "extract_info() должен быть вызван перед загрузкой",
-            YoutubeErrorCode.YT_DLP_ERROR.value: "Произошла внутренняя ошибка yt-dlp",
-        }
-        return descriptions.get(code, "Неизвестная ошибка")
+        return _ERROR_DESCRIPTIONS.get(code, "Неизвестная ошибка")
 
         
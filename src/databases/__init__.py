@@ -2,6 +2,7 @@ from .redis_base import RedisBase
 from .user_storage import UserSessionStorage
 from .media_storage import MediaCacheStorage
 from .user_activity_queue import UserActivityQueue
+from .instagram_session_storage import InstagramSessionStorage
 
 
 __all__ = [
@@ -9,4 +10,5 @@ __all__ = [
     "UserActivityQueue",
     "MediaCacheStorage",
     "UserSessionStorage",
+    "InstagramSessionStorage",
 ]
@@ -0,0 +1,121 @@
+import logging
+from typing import Dict, Optional
+
+from .redis_base import RedisBase
+
+
+# Создание логгера для этого модуля
+logger = logging.getLogger(__name__)
+
+
+class InstagramSessionStorage(RedisBase):
+    """
+    Redis-хранилище авторизованной сессии Instagram.
+
+    Хранит cookies сессии Instaloader по имени пользователя, чтобы все воркеры
+    использовали одну сессию и вход (login) выполнялся один раз на кластер,
+    а не в каждом процессе.
+    """
+
+    def __init__(self, host: str, port: int, db: int, ttl: int = 604800):
+        """
+        Инициализация хранилища сессий Instagram.
+
+        Args:
+            host: Имя хоста Redis-сервера
+            port: Порт Redis-сервера
+            db: Номер базы данных Redis
+            ttl: Время жизни сессии в секундах (по умолчанию: 604800 = 7 дней)
+        """
+        super().__init__(host=host, port=port, db=db)
+        self.ttl = ttl
+        logger.info("InstagramSessionStorage инициализирован: host=%s, port=%s, db=%s, ttl=%ss", host, port, db, ttl)
+
+    def _get_session_key(self, username: str) -> str:
+        """
+        Генерация ключа Redis для сессии Instagram.
+
+        Args:
+            username: Имя пользователя Instagram
+
+        Returns:
+            Строка ключа Redis в формате 'instagram_session:{username}'
+        """
+        return f"instagram_session:{username}"
+
+    def store_session(self, username: str, session_data: Dict[str, str]) -> bool:
+        """
+        Сохранение cookies сессии с истечением срока действия TTL.
+
+        Args:
+            username: Имя пользователя Instagram
+            session_data: Cookies сессии (результат Instaloader.save_session())
+
+        Returns:
+            True если сессия успешно сохранена, False в противном случае
+        """
+        try:
+            result = self.redis_client.setex(
+                name=self._get_session_key(username=username),
+                time=self.ttl,
+                value=self._serialize(session_data)
+            )
+
+            if result:
+                logger.info("Сессия Instagram сохранена для username=%s, ttl=%ss", username, self.ttl)
+            else:
+                logger.warning("Не удалось сохранить сессию Instagram для username=%s", username)
+
+            return result
+
+        except Exception as e:
+            logger.error("Ошибка сохранения сессии Instagram для username=%s: %s", username, e)
+            return False
+
+    def get_session(self, username: str) -> Optional[Dict[str, str]]:
+        """
+        Получение cookies сессии Instagram.
+
+        Args:
+            username: Имя пользователя Instagram
+
+        Returns:
+            Словарь cookies сессии или None, если сессия не найдена
+        """
+        try:
+            data = self.redis_client.get(name=self._get_session_key(username=username))
+
+            if data:
+                logger.debug("Сессия Instagram получена для username=%s", username)
+                return self._deserialize(data=data)
+
+            logger.debug("Сессия Instagram не найдена для username=%s", username)
+            return None
+
+        except Exception as e:
+            logger.error("Ошибка получения сессии Instagram для username=%s: %s", username, e)
+            return None
+
+    def delete_session(self, username: str) -> bool:
+        """
+        Удаление сессии Instagram (например, после отзыва cookies).
+
+        Args:
+            username: Имя пользователя Instagram
+
+        Returns:
+            True если сессия удалена успешно, False в противном случае
+        """
+        try:
+            result = self.redis_client.delete(self._get_session_key(username=username))
+
+            if result:
+                logger.info("Сессия Instagram удалена для username=%s", username)
+            else:
+                logger.debug("Сессия Instagram не найдена для удаления username=%s", username)
+
+            return bool(result)
+
+        except Exception as e:
+            logger.error("Ошибка удаления сессии Instagram для username=%s: %s", username, e)
+            return False
@@ -108,12 +108,7 @@ class MediaCacheStorage(RedisBase):
             
             if data:
                 cache_data = self._deserialize(data=data)
-                
-                self.redis_client.setex(
-                    name=key,
-                    time=self.ttl,
-                    value=self._serialize(data=cache_data)
-                )
+                self.redis_client.expire(name=key, time=self.ttl)
                 
                 logger.debug("Кэш медиа получен для url=%s, TTL обновлен", url)
                 return cache_data
@@ -1,8 +1,13 @@
-import json
 import redis
+import msgspec
 from typing import Any, Optional
 
 
+# Кодек JSON общий для всех хранилищ; несериализуемые объекты приводятся к строке
+_json_encoder = msgspec.json.Encoder(enc_hook=str)
+_json_decoder = msgspec.json.Decoder()
+
+
 class RedisBase:
     """
     Базовый класс для реализаций Redis-хранилищ.
@@ -57,26 +62,26 @@ class RedisBase:
         self.port = port
         self.db = db
     
-    def _serialize(self, data: Any) -> str:
+    def _serialize(self, data: Any) -> bytes:
         """
-        Сериализация Python-объекта в JSON-строку.
+        Сериализация Python-объекта в JSON (UTF-8 байты).
         
-        Преобразует Python-объекты в JSON-формат для хранения в Redis.
-        Обрабатывает несериализуемые объекты, преобразуя их в строки.
+        Преобразует Python-объекты в JSON-формат для хранения в Redis
+        с помощью msgspec. Обрабатывает несериализуемые объекты, преобразуя их в строки.
         
         Args:
             data: Python-объект для сериализации (dict, list, str, int, и т.д.)
             
         Returns:
-            JSON-форматированное строковое представление данных
+            JSON-представление данных в кодировке UTF-8
             
         Пример:
             >>> data = {'user_id': 123, 'media_url': 'https://example.com/video'}
             >>> serialized = storage._serialize(data)
             >>> print(serialized)
-            '{"user_id": 123, "media_url": "https://example.com/video"}'
+            b'{"user_id":123,"media_url":"https://example.com/video"}'
         """
-        return json.dumps(data, ensure_ascii=False, default=str)
+        return _json_encoder.encode(data)
     
     def _deserialize(self, data: str) -> Optional[Any]:
         """
@@ -91,7 +96,7 @@ class RedisBase:
             Десериализованный Python-объект или None если входные данные пусты
             
         Raises:
-            json.JSONDecodeError: Если входная строка не является валидным JSON
+            msgspec.DecodeError: Если входная строка не является валидным JSON
             
         Пример:
             >>> json_string = '{"user_id": 123, "media_url": "https://example.com/video"}'
@@ -100,7 +105,7 @@ class RedisBase:
             {'user_id': 123, 'media_url': 'https://example.com/video'}
         """
         if data:
-            return json.loads(data)
+            return _json_decoder.decode(data)
         return None
     
     def ping(self) -> bool:
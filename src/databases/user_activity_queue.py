@@ -147,7 +147,7 @@ class UserActivityQueue(RedisBase):
             
             if data:
                 session_data = self._deserialize(data=data)
-                self.redis_client.setex(name=key, time=self.ttl, value=self._serialize(session_data))
+                self.redis_client.expire(name=key, time=self.ttl)
                 logger.debug("Задача извлечения получена для chat_id=%s, TTL обновлен", chat_id)
                 return session_data
                 
@@ -174,7 +174,7 @@ class UserActivityQueue(RedisBase):
             
             if data:
                 session_data = self._deserialize(data=data)
-                self.redis_client.setex(name=key, time=self.ttl, value=self._serialize(session_data))
+                self.redis_client.expire(name=key, time=self.ttl)
                 logger.debug("Задача загрузки получена для chat_id=%s, TTL обновлен", chat_id)
                 return session_data
                 
@@ -101,7 +101,7 @@ class UserSessionStorage(RedisBase):
             
             if data:
                 session_data = self._deserialize(data=data)
-                self.redis_client.setex(name=key, time=self.ttl, value=self._serialize(session_data))
+                self.redis_client.expire(name=key, time=self.ttl)
                 logger.debug("Сессия получена для chat_id=%s, TTL обновлен", chat_id)
                 return session_data
                 
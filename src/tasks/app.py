@@ -14,6 +14,7 @@ from src.databases import (
     UserSessionStorage, 
     MediaCacheStorage,
     UserActivityQueue,
+    InstagramSessionStorage,
 )
 
 
@@ -45,11 +46,42 @@ app.conf.update(
 )
 
 
+# ======= Storages =======
+user_session_storage = UserSessionStorage(
+    host=settings.redis_host,
+    port=settings.redis_port,
+    db=settings.user_session_storage,
+)
+
+media_cache_storage = MediaCacheStorage(
+    host=settings.redis_host,
+    port=settings.redis_port,
+    db=settings.media_cache_storage,
+)
+
+user_activity_queue = UserActivityQueue(
+    host=settings.redis_host,
+    port=settings.redis_port,
+    db=settings.user_activity_queue,
+)
+
+# Сессия Instagram общая для всех воркеров и хранится в отдельной базе Redis.
+# Если поле instagram_session_storage не объявлено в Settings или не задано,
+# общее хранилище отключено и каждый воркер использует только файл сессии
+instagram_session_db = getattr(settings, "instagram_session_storage", None)
+instagram_session_storage = InstagramSessionStorage(
+    host=settings.redis_host,
+    port=settings.redis_port,
+    db=instagram_session_db,
+) if instagram_session_db is not None else None
+
+
 # ======= Utils =======
 instagram_downloader = InstagramDownloader(
     username=settings.instagram_username,
     password=settings.instagram_password,
     cookie_path=settings.instagram_cookie_path,
+    session_storage=instagram_session_storage,
 )
 
 reddit_downloader = RedditDownloader(
@@ -69,23 +101,3 @@ tiktok_downloader = TikTokDownloader(
 youtube_downloader = YoutubeDownloader(
     cookie_path=settings.browser_cookie_path,
 )
-
-
-# ======= Storages =======
-user_session_storage = UserSessionStorage(
-    host=settings.redis_host,
-    port=settings.redis_port,
-    db=settings.user_session_storage,
-)
-
-media_cache_storage = MediaCacheStorage(
-    host=settings.redis_host,
-    port=settings.redis_port,
-    db=settings.media_cache_storage,
-)
-
-user_activity_queue = UserActivityQueue(
-    host=settings.redis_host,
-    port=settings.redis_port,
-    db=settings.user_activity_queue,
-)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from collections import defaultdict
 from typing import Dict, List, Optional, Tuple
 from aiogram.enums import ParseMode, ChatAction
 
@@ -87,7 +88,7 @@ class MediaProcessor:
         else:
             for quality in qualities:
                 video = video_by_quality[quality]
-                label = f"🎬 {video['height']}p"
+                label = f"🎬 {video.get('height')}p"
                 if video.get("has_audio"):
                     label += " 🔊"
                 buttons.append(MediaButton(
@@ -143,23 +144,27 @@ class MediaProcessor:
             url=best_thumbnail.get("url")
         )
     
+    @staticmethod
+    def select_best_images(images: List[AbstractServiceImageTypeDict]) -> List[AbstractServiceImageTypeDict]:
+        """Возвращает изображения лучшего качества (максимальной ширины)"""
+        # Группируем изображения по ширине, попутно отслеживая максимальную
+        images_by_width: Dict[int, List[AbstractServiceImageTypeDict]] = defaultdict(list)
+        max_quality = -1
+        for image in images:
+            width = image.get("width") or 0
+            images_by_width[width].append(image)
+            if width > max_quality:
+                max_quality = width
+        
+        return images_by_width[max_quality] if max_quality >= 0 else []
+    
     @staticmethod
     def parse_images(images: List[AbstractServiceImageTypeDict]) -> Optional[MediaButton]:
         """Парсит изображения и создает кнопку"""
         if not images:
             return None
         
-        # Группируем изображения по высоте и берем лучшее качество
-        images_by_width: Dict[int, List[AbstractServiceImageTypeDict]] = {}
-        for image in images:
-            width = image["width"]
-            if width not in images_by_width:
-                images_by_width[width] = []
-            images_by_width[width].append(image)
-        
-        # Находим максимальное качество
-        max_quality = max(images_by_width.keys()) if images_by_width else 0
-        best_images = images_by_width.get(max_quality, [])
+        best_images = MediaProcessor.select_best_images(images)
         
         if not best_images:
             return None
@@ -176,6 +181,25 @@ class MediaProcessor:
         )
 
 
+def _build_session_media(media_data: Dict) -> Dict:
+    """
+    Готовит медиа-данные для пользовательской сессии.
+    
+    Списки видео, аудио и превью заменяются словарями по id, а изображения —
+    заранее выбранными изображениями лучшего качества, чтобы обработчики
+    кнопок находили нужный элемент без перебора списков.
+    """
+    session_media = {
+        key: value for key, value in media_data.items()
+        if key not in ("videos", "audios", "thumbnails", "images")
+    }
+    session_media["videos_by_id"] = {v["id"]: v for v in media_data.get("videos", [])}
+    session_media["audios_by_id"] = {a["id"]: a for a in media_data.get("audios", [])}
+    session_media["thumbnails_by_id"] = {t["id"]: t for t in media_data.get("thumbnails", [])}
+    session_media["best_images"] = MediaProcessor.select_best_images(media_data.get("images", []))
+    return session_media
+
+
 def _create_keyboard_layout(buttons: List[Optional[MediaButton]]) -> List[Tuple[int, str, str]]:
     """Создает раскладку клавиатуры из кнопок"""
     keyboard_data = []
@@ -284,7 +308,7 @@ def _handle_success_response(
         chat_id=chat_id,
         url=url,
         service=service,
-        media_data=media_data,
+        media_data=_build_session_media(media_data),
     )
     
     media_cache_storage.store_media(
@@ -326,8 +350,8 @@ def _handle_success_response(
     caption = (
         f"✅ Медиа готово!\n\n"
         f"📹 Сервис: {service}\n"
-        f"👤 Автор: {media_data['author_name']}\n"
-        f"📝 Заголовок: {media_data['title']}\n\n"
+        f"👤 Автор: {media_data.get('author_name')}\n"
+        f"📝 Заголовок: {media_data.get('title')}\n\n"
         "👇 Выберите действие:"
     )
     
@@ -1,21 +1,37 @@
+from functools import cache
 from typing import List, Tuple, Optional
 from collections import Counter
 
-from aiogram.enums import ChatAction
+import msgspec
+from aiogram import Bot
+from aiogram.enums import ChatAction, ParseMode
+from aiogram.client.telegram import TelegramAPIServer
+from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.utils.text_decorations import HtmlDecoration
 from aiogram.types import InlineKeyboardMarkup, FSInputFile, Message
 
-from src.app import TelegramBot
 from src.config import settings
 
 
-def create_bot_for_worker() -> TelegramBot:
-    telegram_bot = TelegramBot(
+@cache
+def create_bot_for_worker() -> Bot:
+    """
+    Возвращает единственный на процесс экземпляр Bot для воркера.
+    
+    Воркеру нужен только клиент Bot API, поэтому диспетчер и обработчики
+    TelegramBot не создаются, а пакет src.app не импортируется.
+    """
+    session = AiohttpSession(
+        api=TelegramAPIServer.from_base(settings.bot_server_ip),
+        json_loads=msgspec.json.decode
+    )
+    return Bot(
         token=settings.bot_token,
-        server_ip=settings.bot_server_ip,
+        session=session,
+        default=DefaultBotProperties(parse_mode=ParseMode.HTML)
     )
-    return telegram_bot
 
 
 def _get_adjust_list(data: List[Tuple[int, str, str]]) -> List[int]:
@@ -40,8 +56,8 @@ def _get_inline_keyboard(data: List[Tuple[int, str, str]]) -> InlineKeyboardMark
 
 
 async def delete_message(chat_id: int, message_id: int) -> None:
-    telegram = create_bot_for_worker()
-    await telegram.bot.delete_message(chat_id=chat_id, message_id=message_id)
+    bot = create_bot_for_worker()
+    await bot.delete_message(chat_id=chat_id, message_id=message_id)
 
 
 async def send_message(
@@ -51,7 +67,7 @@ async def send_message(
     parse_mode: str = "HTML",
     reply_to_message_id: Optional[int] = None,
 ) -> Message:
-    telegram_bot = create_bot_for_worker()
+    bot = create_bot_for_worker()
 
     if parse_mode == "HTML" and text:
         html_decoration = HtmlDecoration()
@@ -68,7 +84,7 @@ async def send_message(
     if reply_to_message_id:
         send_params["reply_to_message_id"] = reply_to_message_id
 
-    return await telegram_bot.bot.send_message(**send_params)
+    return await bot.send_message(**send_params)
 
 
 async def send_photo(
@@ -80,7 +96,7 @@ async def send_photo(
     keyboard_data: Optional[List[Tuple[int, str, str]]] = None,
     reply_to_message_id: Optional[int] = None,
 ) -> Message:
-    telegram_bot = create_bot_for_worker()
+    bot = create_bot_for_worker()
 
     safe_caption = ""
     if caption:
@@ -103,7 +119,7 @@ async def send_photo(
     if reply_to_message_id:
         send_params["reply_to_message_id"] = reply_to_message_id
 
-    return await telegram_bot.bot.send_photo(**send_params)
+    return await bot.send_photo(**send_params)
 
 
 async def send_video(
@@ -115,7 +131,7 @@ async def send_video(
     reply_to_message_id: Optional[int] = None,
     supports_streaming: bool = True,
 ) -> Message:
-    telegram_bot = create_bot_for_worker()
+    bot = create_bot_for_worker()
 
     safe_caption = ""
     if caption:
@@ -139,7 +155,7 @@ async def send_video(
     if reply_to_message_id:
         send_params["reply_to_message_id"] = reply_to_message_id
 
-    return await telegram_bot.bot.send_video(**send_params)
+    return await bot.send_video(**send_params)
 
 
 async def send_audio(
@@ -152,7 +168,7 @@ async def send_audio(
     thumbnail_path: Optional[str] = None,  # локальный путь к миниатюре
     keyboard_data: Optional[List[Tuple[int, str, str]]] = None,
 ) -> Message:
-    telegram_bot = create_bot_for_worker()
+    bot = create_bot_for_worker()
 
     safe_caption = HtmlDecoration().quote(caption) if caption else ""
 
@@ -176,14 +192,14 @@ async def send_audio(
     if thumbnail_path:
         send_params["thumbnail"] = FSInputFile(thumbnail_path)
 
-    return await telegram_bot.bot.send_audio(**send_params)
+    return await bot.send_audio(**send_params)
 
 
 async def send_chat_action(chat_id: int, action: str):
     """
     Отправляет действие чата (ChatAction) чтобы показать статус отправки.
     """
-    telegram_bot = create_bot_for_worker()
+    bot = create_bot_for_worker()
     
     action_map = {
         "upload_video": ChatAction.UPLOAD_VIDEO,
@@ -195,7 +211,7 @@ async def send_chat_action(chat_id: int, action: str):
     chat_action = action_map.get(action, ChatAction.TYPING)
     
     try:
-        await telegram_bot.bot.send_chat_action(
+        await bot.send_chat_action(
             chat_id=chat_id,
             action=chat_action
         )